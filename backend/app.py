@@ -1,140 +1,182 @@
-import pandas as pd
-import joblib
-import numpy as np
-from flask import Flask, request, jsonify
+import gzip
+import hmac
+import logging
+import os
+import time
+from flask import Blueprint, Flask, current_app, g, request, jsonify
 from flask_cors import CORS
-from feature_extractor import NBAFeatureExtractor
-
-app = Flask(__name__)
-CORS(app, origins=['http://localhost:5174', 'http://localhost:5173'])
-
-# Load model and feature extractor
-print("🚀 Loading simple model and feature extractor...")
-try:
-    model_bundle = joblib.load('models/simple_clean_model.pkl')
-    model = model_bundle['model']
-    scaler = model_bundle['scaler']
-    predictors = model_bundle['predictors']
-    print(f"✅ Simple model loaded with {len(predictors)} features")
-except:
-    print("❌ Simple model not found, please run retrain_simple_model.py first")
-    model_bundle = None
-
-extractor = NBAFeatureExtractor()
-team_stats = pd.read_csv('data/team_stats.csv')
-
-@app.route('/api/predict', methods=['POST'])
+from metrics import metrics
+from service import PredictionService
+
+# Per-request detail is logged at DEBUG, so the default INFO level pays nothing for it
+LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO').upper()
+logging.basicConfig(level=LOG_LEVEL, format='%(asctime)s %(levelname)s %(name)s: %(message)s')
+logger = logging.getLogger('nba_api')
+
+# Shared secret for /api/admin/* endpoints; admin access is disabled when unset
+ADMIN_TOKEN = os.environ.get('ADMIN_TOKEN')
+
+# Request-level metrics exposed on /metrics
+request_count = metrics.counter('nba_requests_total', 'HTTP requests served', ['endpoint', 'status'])
+request_seconds = metrics.histogram('nba_request_seconds', 'HTTP request latency', ['endpoint'])
+
+api = Blueprint('api', __name__)
+
+def get_service():
+    """The PredictionService bound to the running app"""
+    return current_app.extensions['nba']
+
+def is_admin_request():
+    """Check the request's bearer token against ADMIN_TOKEN"""
+    if not ADMIN_TOKEN:
+        return False
+    auth = request.headers.get('Authorization', '')
+    token = auth[len('Bearer '):] if auth.startswith('Bearer ') else ''
+    return hmac.compare_digest(token.encode(), ADMIN_TOKEN.encode())
+
+def respond(result):
+    payload, status = result
+    return jsonify(payload), status
+
+@api.route('/api/predict', methods=['POST'])
 def predict_game():
     data = request.get_json()
-    home_team = data['home_team']
-    away_team = data['away_team']
-    
-    if model_bundle is None:
-        return jsonify({'error': 'Model not loaded'}), 500
-    
-    try:
-        print(f"\n🏀 CLEAN PREDICTION: {home_team} (home) vs {away_team} (away)")
-        
-        # Extract real features using actual game data
-        features = extractor.get_prediction_features(home_team, away_team)
-        
-        if features is None:
-            raise Exception("Could not extract features for these teams")
-        
-        print(f"📊 Extracted {len(features)} clean features (no usage rates)")
-        print(f"Sample features: {features[:5]}")
-        
-        # Scale and predict
-        features_scaled = scaler.transform([features])
-        home_win_prob = model.predict_proba(features_scaled)[0][1]
-        away_win_prob = 1 - home_win_prob
-        
-        winner = home_team if home_win_prob > 0.5 else away_team
-        
-        # Score prediction based on team stats
-        home_team_stats = team_stats[team_stats['Team'] == home_team].iloc[0]
-        away_team_stats = team_stats[team_stats['Team'] == away_team].iloc[0]
-        
-        base_home = home_team_stats['PTS']
-        base_away = away_team_stats['PTS']
-        
-        # Realistic score adjustments
-        home_score = int(base_home + (home_win_prob - 0.5) * 20)
-        away_score = int(base_away + (away_win_prob - 0.5) * 20)
-        
-        print(f"🎯 RESULT: {home_team} {home_win_prob:.1%} vs {away_team} {away_win_prob:.1%}")
-        print(f"📊 Feature range: {min(features):.2f} to {max(features):.2f}")
-        
-        return jsonify({
-            'winner': winner,
-            'home_team': home_team,
-            'away_team': away_team,
-            'home_win_probability': float(home_win_prob),
-            'away_win_probability': float(away_win_prob),
-            'predicted_score': {
-                'home': home_score,
-                'away': away_score
-            }
-        })
-        
-    except Exception as e:
-        print(f"❌ Error: {e}")
-        
-        # Enhanced fallback using team stats
-        try:
-            home_team_stats = team_stats[team_stats['Team'] == home_team].iloc[0]
-            away_team_stats = team_stats[team_stats['Team'] == away_team].iloc[0]
-            
-            home_win_rate = home_team_stats['W'] / home_team_stats['GP']
-            away_win_rate = away_team_stats['W'] / away_team_stats['GP']
-            
-            # Factor in team strength and home advantage
-            strength_diff = (home_win_rate - away_win_rate) * 0.4
-            home_advantage = 0.06
-            
-            home_win_prob = 0.5 + strength_diff + home_advantage
-            home_win_prob = max(0.25, min(0.75, home_win_prob))
-            away_win_prob = 1 - home_win_prob
-            
-            winner = home_team if home_win_prob > 0.5 else away_team
-            
-            return jsonify({
-                'winner': winner,
-                'home_team': home_team,
-                'away_team': away_team,
-                'home_win_probability': float(home_win_prob),
-                'away_win_probability': float(away_win_prob),
-                'predicted_score': {
-                    'home': int(home_team_stats['PTS']),
-                    'away': int(away_team_stats['PTS'])
-                }
-            })
-        except:
-            return jsonify({'error': str(e)}), 500
-
-@app.route('/api/teams', methods=['GET'])
+    return respond(get_service().predict(data['home_team'], data['away_team'], as_of=data.get('date')))
+
+@api.route('/api/predict/explain', methods=['POST'])
+def explain_prediction():
+    data = request.get_json()
+    return respond(get_service().explain(data['home_team'], data['away_team']))
+
+@api.route('/api/predict/batch', methods=['POST'])
+def predict_batch():
+    data = request.get_json(silent=True) or {}
+    return respond(get_service().predict_batch(data.get('matchups')))
+
+@api.route('/api/matchups/matrix', methods=['GET'])
+def matchup_matrix():
+    return respond(get_service().matchup_matrix())
+
+@api.route('/api/simulate', methods=['POST'])
+def simulate_season():
+    data = request.get_json(silent=True) or {}
+    return respond(get_service().simulate(
+        data.get('games'),
+        simulations=data.get('simulations', 10000),
+        seed=data.get('seed', 0),
+        wins=data.get('wins')
+    ))
+
+@api.route('/api/admin/ingest', methods=['POST'])
+def ingest_games():
+    if not is_admin_request():
+        return jsonify({'error': 'Unauthorized'}), 401
+
+    data = request.get_json(silent=True) or {}
+    return respond(get_service().ingest(data.get('games')))
+
+@api.route('/api/admin/reload-model', methods=['POST'])
+def reload_model():
+    if not is_admin_request():
+        return jsonify({'error': 'Unauthorized'}), 401
+
+    return respond(get_service().reload_model())
+
+@api.route('/api/cache/stats', methods=['GET'])
+def cache_stats():
+    return jsonify(get_service().prediction_cache.stats())
+
+@api.route('/metrics', methods=['GET'])
+def prometheus_metrics():
+    return current_app.response_class(metrics.render(), mimetype='text/plain; version=0.0.4')
+
+@api.route('/api/teams', methods=['GET'])
 def get_teams():
-    teams_data = []
-    
-    for _, team in team_stats.iterrows():
-        teams_data.append({
-            'name': team['Team'],
-            'games_played': int(team['GP']),
-            'wins': int(team['W']),
-            'losses': int(team['L']),
-            'win_percentage': team['W'] / team['GP'],
-            'points_per_game': float(team['PTS']),
-            'field_goal_percentage': float(team['FG%']),
-            'three_point_percentage': float(team['3P%']),
-            'free_throw_percentage': float(team['FT%']),
-            'rebounds_per_game': float(team['TRB']),
-            'assists_per_game': float(team['AST']),
-            'steals_per_game': float(team['STL']),
-            'blocks_per_game': float(team['BLK']),
-            'turnovers_per_game': float(team['TOV'])
-        })
-    
-    return jsonify(teams_data)
+    team_stats = get_service().team_stats
+    team_stats.refresh()
+
+    # Pre-serialized payload; repeat fetches with a matching ETag get a 304
+    payload, etag = team_stats.teams_response
+    response = current_app.response_class(payload, mimetype='application/json')
+    response.set_etag(etag)
+    response.cache_control.no_cache = True  # browsers revalidate instead of refetching
+    return response.make_conditional(request)
+
+# Snapshot files never change once written; only the "latest" pointer moves
+SNAPSHOT_MAX_AGE = 365 * 24 * 3600
+LATEST_SNAPSHOT_MAX_AGE = 60
+
+def snapshot_response(compressed):
+    """Serve stored gzip bytes as-is, inflating only for clients without gzip"""
+    if 'gzip' in request.accept_encodings:
+        response = current_app.response_class(compressed, mimetype='application/json')
+        response.headers['Content-Encoding'] = 'gzip'
+    else:
+        response = current_app.response_class(gzip.decompress(compressed), mimetype='application/json')
+    response.vary.add('Accept-Encoding')
+    return response
+
+@api.route('/api/upcoming', methods=['GET'])
+def upcoming_games():
+    snapshots = get_service().snapshots
+    if snapshots is not None:
+        snapshots.refresh()
+    latest = snapshots.latest if snapshots is not None else None
+    if latest is None:
+        return jsonify({'error': 'No prediction snapshot available'}), 404
+    version, compressed = latest
+
+    # Short-lived and revalidated; the versioned URL below is cacheable forever
+    response = snapshot_response(compressed)
+    response.set_etag(version)
+    response.headers['Content-Location'] = f'/api/snapshots/{version}.json'
+    response.cache_control.public = True
+    response.cache_control.max_age = LATEST_SNAPSHOT_MAX_AGE
+    return response.make_conditional(request)
+
+@api.route('/api/snapshots/<version>.json', methods=['GET'])
+def snapshot(version):
+    snapshots = get_service().snapshots
+    compressed = snapshots.get(version) if snapshots is not None else None
+    if compressed is None:
+        return jsonify({'error': f'No snapshot {version}'}), 404
+
+    response = snapshot_response(compressed)
+    response.set_etag(version)
+    response.cache_control.public = True
+    response.cache_control.max_age = SNAPSHOT_MAX_AGE
+    response.cache_control.immutable = True
+    return response.make_conditional(request)
+
+def start_timer():
+    g.request_start = time.perf_counter()
+
+def record_request(response):
+    # View name without the blueprint prefix, so labels read 'predict_game'
+    endpoint = request.endpoint.rsplit('.', 1)[-1] if request.endpoint else 'unmatched'
+    if 'request_start' in g:
+        request_seconds.observe(time.perf_counter() - g.request_start, endpoint=endpoint)
+    request_count.inc(endpoint=endpoint, status=response.status_code)
+    return response
+
+def create_app(service=None):
+    """Build the Flask app around a PredictionService (loaded from disk by default)"""
+    if service is None:
+        service = PredictionService.from_environment()
+
+    app = Flask(__name__)
+    CORS(app, origins=['http://localhost:5174', 'http://localhost:5173'])
+    app.extensions['nba'] = service
+
+    app.before_request(start_timer)
+    app.after_request(record_request)
+    app.register_blueprint(api)
+    return app
+
+# Module-level app for `python app.py` and `gunicorn app:app` (see gunicorn.conf.py).
+# Simulation pool workers re-import the main script as __mp_main__ and don't need one.
+if __name__ != '__mp_main__':
+    app = create_app()
 
 if __name__ == '__main__':
-    app.run(debug=True, port=3001)
\ No newline at end of file
+    app.run(debug=True, port=3001)
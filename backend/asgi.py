@@ -0,0 +1,168 @@
+# ASGI entry point: uvicorn asgi:app --port 3001
+#
+# Serves the /api/predict, /api/predict/explain and /api/teams contract of
+# app.py from an event loop. Scoring runs on a bounded thread pool, identical
+# matchups in flight share one computation, and bursts are scored with one
+# predict_proba call.
+import asyncio
+import json
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from metrics import metrics
+from micro_batcher import MicroBatcher
+from service import PredictionService
+
+LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO').upper()
+logging.basicConfig(level=LOG_LEVEL, format='%(asctime)s %(levelname)s %(name)s: %(message)s')
+logger = logging.getLogger('nba_api')
+
+ALLOWED_ORIGINS = {'http://localhost:5174', 'http://localhost:5173'}
+
+# Largest request body accepted for /api/predict
+MAX_BODY_BYTES = 64 * 1024
+
+class PredictionASGIApp:
+    """Minimal ASGI application around a PredictionService"""
+
+    def __init__(self, service, threads=4, max_batch_size=64, max_delay=0.002):
+        self.service = service
+        self.executor = ThreadPoolExecutor(max_workers=threads, thread_name_prefix='nba-score')
+        self.batcher = MicroBatcher(service.predict_many, self.executor,
+                                    max_batch_size=max_batch_size, max_delay=max_delay, max_in_flight=threads)
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            await self.lifespan(receive, send)
+            return
+        if scope['type'] != 'http':
+            return
+
+        headers = dict(scope['headers'])
+        origin = headers.get(b'origin', b'').decode('latin-1')
+        path, method = scope['path'], scope['method']
+
+        if method == 'OPTIONS':
+            await self.send_response(send, 204, b'', origin, extra=[
+                (b'access-control-allow-methods', b'GET, POST, OPTIONS'),
+                (b'access-control-allow-headers', b'Content-Type')
+            ])
+        elif path == '/api/predict' and method == 'POST':
+            payload, status = await self.predict(receive)
+            await self.send_json(send, payload, status, origin)
+        elif path == '/api/predict/explain' and method == 'POST':
+            payload, status = await self.explain(receive)
+            await self.send_json(send, payload, status, origin)
+        elif path == '/api/teams' and method == 'GET':
+            await self.teams(send, headers, origin)
+        elif path == '/metrics' and method == 'GET':
+            await self.send_response(send, 200, metrics.render().encode(), origin,
+                                     content_type=b'text/plain; version=0.0.4')
+        else:
+            await self.send_json(send, {'error': 'Not found'}, 404, origin)
+
+    async def lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                self.executor.shutdown(wait=False)
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def predict(self, receive):
+        data = await read_matchup(receive)
+        if data is None:
+            return {'error': 'Expected a JSON body with home_team and away_team'}, 400
+        home_team, away_team = data['home_team'], data['away_team']
+
+        # Historical (as-of) lookups are rare and keyed by date, so they skip the batcher
+        if data.get('date') is not None:
+            return await asyncio.get_running_loop().run_in_executor(
+                self.executor, self.service.predict, home_team, away_team, data['date'])
+
+        # Cache hits are answered on the event loop without touching the executor
+        cached = self.service.cached_prediction(home_team, away_team)
+        if cached is not None:
+            return cached, 200
+
+        return await self.batcher.submit((home_team, away_team))
+
+    async def explain(self, receive):
+        data = await read_matchup(receive)
+        if data is None:
+            return {'error': 'Expected a JSON body with home_team and away_team'}, 400
+
+        # Cached explanations are answered on the event loop, like predictions
+        cached = self.service.cached_explanation(data['home_team'], data['away_team'])
+        if cached is not None:
+            return cached, 200
+
+        return await asyncio.get_running_loop().run_in_executor(
+            self.executor, self.service.explain, data['home_team'], data['away_team'])
+
+    async def teams(self, send, headers, origin):
+        team_stats = self.service.team_stats
+        team_stats.refresh()
+
+        # Same pre-serialized payload and ETag as the Flask route
+        payload, etag = team_stats.teams_response
+        etag = f'"{etag}"'.encode()
+        extra = [(b'etag', etag), (b'cache-control', b'no-cache')]
+        if etag in [tag.strip() for tag in headers.get(b'if-none-match', b'').split(b',')]:
+            await self.send_response(send, 304, b'', origin, extra=extra)
+        else:
+            await self.send_response(send, 200, payload, origin, extra=extra)
+
+    async def send_json(self, send, payload, status, origin):
+        await self.send_response(send, status, json.dumps(payload).encode(), origin)
+
+    async def send_response(self, send, status, body, origin, content_type=b'application/json', extra=()):
+        headers = [(b'content-length', str(len(body)).encode())]
+        if status != 304 and body:
+            headers.append((b'content-type', content_type))
+        if origin in ALLOWED_ORIGINS:
+            headers.append((b'access-control-allow-origin', origin.encode()))
+            headers.append((b'vary', b'Origin'))
+        headers.extend(extra)
+        await send({'type': 'http.response.start', 'status': status, 'headers': headers})
+        await send({'type': 'http.response.body', 'body': body})
+
+async def read_body(receive):
+    chunks = []
+    size = 0
+    while True:
+        message = await receive()
+        chunk = message.get('body', b'')
+        size += len(chunk)
+        if size > MAX_BODY_BYTES:
+            return b''
+        chunks.append(chunk)
+        if not message.get('more_body'):
+            return b''.join(chunks)
+
+async def read_matchup(receive):
+    """The JSON request body if it names home_team and away_team as strings, else None"""
+    body = await read_body(receive)
+    try:
+        data = json.loads(body)
+        home_team, away_team = data['home_team'], data['away_team']
+    except (ValueError, TypeError, KeyError):
+        return None
+    if not isinstance(home_team, str) or not isinstance(away_team, str):
+        return None
+    return data
+
+def create_asgi_app(service=None):
+    """Build the ASGI app around a PredictionService (loaded from disk by default)"""
+    if service is None:
+        service = PredictionService.from_environment()
+    return PredictionASGIApp(
+        service,
+        threads=int(os.environ.get('ASGI_SCORING_THREADS', 4)),
+        max_batch_size=int(os.environ.get('MICRO_BATCH_SIZE', 64)),
+        max_delay=float(os.environ.get('MICRO_BATCH_DELAY_MS', 2)) / 1000
+    )
+
+app = create_asgi_app()
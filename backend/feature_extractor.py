@@ -1,23 +1,339 @@
 import pandas as pd
 import numpy as np
+import logging
+import os
+import threading
+from collections import deque
 from datetime import datetime, timedelta
+from feature_store import KEY_COLUMNS, file_checksum, load_feature_store, write_feature_store
+
+logger = logging.getLogger(__name__)
+
+# Feature order the model expects (excluding usage rates)
+PREDICTORS = [
+    'fga', 'fg_opp', 'orb_opp', 'stl%_opp', 'pf_max_opp', 'orb%_max_opp',
+    'efg%_10_x', 'fg_max_10_x', '+/-_max_10_x', 'trb%_max_10_x', 'blk_opp_10_x',
+    'drb%_opp_10_x', 'ft%_max_opp_10_x', '+/-_max_opp_10_x', 'efg%_max_opp_10_x',
+    'home_next', 'mp_10_y', 'gmsc_max_10_y', 'blk%_opp_10_y',
+    'ft%_max_opp_10_y', 'ast_max_opp_10_y', '+/-_max_opp_10_y'
+]
+
+# Where each predictor comes from: which side of the matchup, the columns to
+# read from that team's latest row (first one present wins) and the default
+# used when none of them exist
+FEATURE_SOURCES = {
+    # Basic team stats
+    'fga': ('team', ['fga'], 85.0),
+    'fg_opp': ('opponent', ['fg'], 40.0),
+    'orb_opp': ('opponent', ['orb'], 10.0),
+    'stl%_opp': ('opponent', ['stl%'], 0.08),
+    'pf_max_opp': ('opponent', ['pf_max'], 6.0),
+    'orb%_max_opp': ('opponent', ['orb%_max'], 0.15),
+
+    # Rolling features that exist (avoiding usage rates)
+    'efg%_10_x': ('team', ['efg%_10_x', 'efg%'], 0.52),
+    'fg_max_10_x': ('team', ['fg_max_10_x', 'fg_max'], 15.0),
+    '+/-_max_10_x': ('team', ['+/-_max_10_x', '+/-_max'], 5.0),
+    'trb%_max_10_x': ('team', ['trb%_max_10_x', 'trb%_max'], 0.25),
+
+    # Rolling opponent features
+    'blk_opp_10_x': ('team', ['blk_opp_10_x', 'blk_opp'], 5.0),
+    'drb%_opp_10_x': ('team', ['drb%_opp_10_x', 'drb%_opp'], 0.75),
+    'ft%_max_opp_10_x': ('team', ['ft%_max_opp_10_x', 'ft%_max_opp'], 0.8),
+    '+/-_max_opp_10_x': ('team', ['+/-_max_opp_10_x', '+/-_max_opp'], -5.0),
+    'efg%_max_opp_10_x': ('team', ['efg%_max_opp_10_x', 'efg%_max_opp'], 0.55),
+
+    # Home court advantage
+    'home_next': (None, [], 1.0),
+
+    # Team Y features (opponent perspective)
+    'mp_10_y': ('opponent', ['mp_10_x'], 240.0),
+    'gmsc_max_10_y': ('opponent', ['gmsc_max_10_x', 'gmsc_max'], 15.0),
+    'blk%_opp_10_y': ('opponent', ['blk%_opp_10_x', 'blk%_opp'], 0.06),
+    'ft%_max_opp_10_y': ('opponent', ['ft%_max_opp_10_x', 'ft%_max_opp'], 0.8),
+    'ast_max_opp_10_y': ('opponent', ['ast_max_opp_10_x', 'ast_max_opp'], 8.0),
+    '+/-_max_opp_10_y': ('opponent', ['+/-_max_opp_10_x', '+/-_max_opp'], -3.0),
+}
+
+# Slots filled from the opponent's row; every other slot comes from the team
+OPPONENT_MASK = np.array([FEATURE_SOURCES[name][0] == 'opponent' for name in PREDICTORS])
+HOME_SLOT = PREDICTORS.index('home_next')
+
+# Core basketball stats that are always numeric
+CORE_ROLLING_FEATURES = [
+    'fg', 'fga', 'fg%', '3p', '3pa', '3p%', 'ft', 'fta', 'ft%',
+    'orb', 'drb', 'trb', 'ast', 'stl', 'blk', 'tov', 'pf', 'pts',
+    'ts%', 'efg%', '+/-'
+]
+
+# Rows parsed at a time by the streaming loader
+STREAM_CHUNK_ROWS = 10000
+
+def rolling_sources(columns, is_numeric=lambda col: True):
+    """Raw columns that get rolling averages: (core stats, max stats, opponent stats)
+    
+    Usage rate columns are always left out; won is handled by the caller.
+    """
+    core = [col for col in CORE_ROLLING_FEATURES if col in columns and is_numeric(col)]
+    max_features = [
+        col for col in columns
+        if col.endswith('_max') and not col.endswith('_opp') and 'usg' not in col.lower() and is_numeric(col)
+    ]
+    opp_features = [
+        col for col in columns
+        if col.endswith('_opp') and not col.endswith('_max_opp') and 'usg' not in col.lower() and is_numeric(col)
+    ]
+    return core, max_features, opp_features
+
+def rolling_means(values, segment_starts, windows):
+    """Trailing window means of a 2-D block for each window, restarting at each segment
+    
+    Rows must be grouped into contiguous segments (one per team) that begin
+    at segment_starts. Like pandas rolling(window, min_periods=1).mean(),
+    NaNs are skipped and a window with no values gives NaN. Every column is
+    handled at once by differencing cumulative sums and counts, which are
+    computed once and shared by all windows. Returns {window: means}.
+    """
+    n_rows = len(values)
+    present = ~np.isnan(values)
+    
+    # Prefix sums with a leading zero row: sum(rows a..b-1) = csum[b] - csum[a]
+    csum = np.zeros((n_rows + 1, values.shape[1]))
+    np.cumsum(np.where(present, values, 0.0), axis=0, out=csum[1:])
+    ccount = np.zeros((n_rows + 1, values.shape[1]))
+    np.cumsum(present, axis=0, out=ccount[1:])
+    
+    segment_lengths = np.diff(np.r_[segment_starts, n_rows])
+    row_segment_start = np.repeat(segment_starts, segment_lengths)
+    ends = np.arange(1, n_rows + 1)
+    
+    means = {}
+    for window in windows:
+        # Each row's window starts window-1 rows back: a shifted slice of the prefix sums
+        sums = np.empty_like(values, dtype=np.float64)
+        counts = np.empty_like(sums)
+        if window <= n_rows:
+            np.subtract(csum[window:], csum[:-window], out=sums[window - 1:])
+            np.subtract(ccount[window:], ccount[:-window], out=counts[window - 1:])
+        
+        # ...but never before its segment; only the first rows of each segment need fixing
+        clamped = np.flatnonzero(ends - window < row_segment_start)
+        sums[clamped] = csum[clamped + 1] - csum[row_segment_start[clamped]]
+        counts[clamped] = ccount[clamped + 1] - ccount[row_segment_start[clamped]]
+        
+        with np.errstate(invalid='ignore', divide='ignore'):
+            np.divide(sums, counts, out=sums)
+        sums[counts == 0] = np.nan
+        means[window] = sums
+    return means
+
+def window_means(history, window):
+    """NaN-skipping means of the last `window` rows of a team's ring buffer"""
+    recent = history[-window:]
+    present = ~np.isnan(recent)
+    counts = present.sum(axis=0)
+    sums = np.where(present, recent, 0.0).sum(axis=0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(counts > 0, sums / np.maximum(counts, 1), np.nan)
+
+def shrink_frame(frame):
+    """Downcast float columns to float32 and store team codes as categoricals"""
+    frame = frame.astype({
+        col: np.float32 for col in frame.columns
+        if pd.api.types.is_float_dtype(frame[col])
+    })
+    for col in ('team', 'team_opp'):
+        if col in frame.columns:
+            frame[col] = frame[col].astype('category')
+    return frame
 
 class NBAFeatureExtractor:
-    def __init__(self, nba_games_path='data/nba_games.csv'):
-        """Load and prepare NBA games data for feature extraction"""
+    def __init__(self, nba_games_path='data/nba_games.csv', store_path=None, rolling_windows=(10,), lean=False,
+                 streaming=False):
+        """Load and prepare NBA games data for feature extraction
+        
+        With store_path set, the processed frame is memory-mapped from that
+        feature store when it matches the CSV's checksum and store_inputs(), and
+        (re)built there otherwise. rolling_windows picks the rolling average lengths; the
+        model reads the 10-game columns. lean=True keeps only what serving
+        needs (see compact()). streaming=True gets the same lean result by
+        reading the CSV in chunks (see load_streaming()), so memory does not
+        grow with the history; a stale feature store is then left as is.
+        """
         print("🏀 Loading NBA games data...")
         
-        self.df = pd.read_csv(nba_games_path, index_col=0)
-        self.df['date'] = pd.to_datetime(self.df['date'])
-        self.df = self.df.sort_values(['team', 'date']).reset_index(drop=True)
+        self.rolling_windows = tuple(rolling_windows)
+        self.lean = False
+        
+        # Serializes append_games and consolidate; lookups never take it
+        self.ingest_lock = threading.Lock()
+        
+        # Games appended to a full-history frame but not merged into it yet (see consolidate)
+        self.pending_games = []
+        self.data_version = 0
+        
+        # Built on the first as-of query (see build_date_index)
+        self.date_index = None
+        
+        if store_path is not None and self.load_store(nba_games_path, store_path):
+            source = f"feature store {store_path}"
+        elif streaming:
+            self.load_streaming(nba_games_path)
+            source = f"{nba_games_path} (streamed)"
+        else:
+            self.df = pd.read_csv(nba_games_path, index_col=0)
+            self.df['date'] = pd.to_datetime(self.df['date'])
+            self.df = self.df.sort_values(['team', 'date']).reset_index(drop=True)
+            
+            # Remove all usage rate columns completely
+            self.remove_usage_columns()
+            
+            # Create rolling averages for clean features only
+            self.create_rolling_features()
+            
+            if store_path is not None:
+                self.save_store(store_path, file_checksum(nba_games_path))
+            source = nba_games_path
+        
+        # Index each team's latest feature vector for O(1) lookups
+        self.build_team_index()
+        
+        if self.lean:
+            # Streamed frames already hold one row per team and filled ring buffers
+            self.df = shrink_frame(self.df)
+        elif lean or streaming:
+            self.compact()
+        else:
+            self.build_ring_buffers()
+        
+        print(f"✅ Loaded {len(self.df)} games from {source}, prepared rolling features")
+    
+    def load_store(self, nba_games_path, store_path):
+        """Memory-map a prepared frame from the feature store if it is current"""
+        checksum = file_checksum(nba_games_path)
+        df = load_feature_store(store_path, checksum, self.store_inputs())
         
-        # Remove all usage rate columns completely
-        self.remove_usage_columns()
+        if df is None:
+            print(f"♻️ Feature store {store_path} missing or stale, rebuilding from CSV")
+            return False
         
-        # Create rolling averages for clean features only
-        self.create_rolling_features()
+        self.df = df
+        return True
+    
+    def store_inputs(self):
+        """What a feature store is built from besides the CSV: rolling windows and this module's code
+        
+        PREDICTORS, FEATURE_SOURCES and the rolling logic all live here, so
+        any edit to them makes existing stores stale.
+        """
+        return {
+            'rolling_windows': list(self.rolling_windows),
+            'code': file_checksum(os.path.abspath(__file__))
+        }
+    
+    def save_store(self, store_path, source_checksum):
+        """Write the columns the model needs to a columnar feature store"""
+        self.consolidate()
+        self.feature_columns = self.resolve_feature_columns()
+        columns = [col for col in KEY_COLUMNS if col in self.df.columns]
+        columns += [col for col in dict.fromkeys(self.feature_columns) if col is not None and col not in columns]
+        
+        # Keep the raw stats behind those rolling columns so ingestion can extend them
+        rolling_columns = self.find_rolling_columns()
+        columns += [
+            rolling_columns[col][0] for col in list(columns)
+            if col in rolling_columns and rolling_columns[col][0] not in columns
+        ]
         
-        print(f"✅ Loaded {len(self.df)} games, prepared rolling features")
+        required = [col for col in self.feature_columns if col is not None]
+        write_feature_store(self.df, columns, store_path, source_checksum, self.store_inputs(), required)
+        print(f"💾 Wrote {len(columns)} columns to feature store {store_path}")
+    
+    def load_streaming(self, nba_games_path, chunksize=STREAM_CHUNK_ROWS):
+        """Fold the CSV into per-team state chunk by chunk instead of loading it whole
+        
+        Only the columns the feature index needs are parsed, each with an
+        explicit dtype, so usage rates and unused stats are never read. Each
+        team keeps its latest row and a ring buffer of its last games of raw
+        stats; peak memory depends on chunksize and the number of teams, not
+        on the length of the history. The result is the frame compact()
+        leaves behind. Each team's games must appear in date order, as they
+        do in nba_games.csv.
+        """
+        print(f"🌊 Streaming {nba_games_path} in chunks of {chunksize} rows...")
+        
+        file_columns = pd.read_csv(nba_games_path, nrows=0).columns
+        header = [col for col in file_columns if 'usg' not in col.lower()]
+        
+        # Work out the rolling and feature columns from the header alone
+        core, max_features, opp_features = rolling_sources(header)
+        rollable = core + (['won'] if 'won' in header else []) + max_features + opp_features
+        rolling_names = {
+            f'{raw}_{window}_x': (raw, window)
+            for window in self.rolling_windows for raw in rollable
+        }
+        self.feature_columns = self.resolve_feature_columns(set(header) | set(rolling_names))
+        
+        self.rolling_columns = {col: source for col, source in rolling_names.items() if col in self.feature_columns}
+        self.buffer_columns = list(dict.fromkeys(raw for raw, _ in self.rolling_columns.values()))
+        
+        columns = [col for col in KEY_COLUMNS if col in header]
+        columns += [col for col in dict.fromkeys(self.feature_columns) if col is not None and col not in columns]
+        row_columns = [col for col in columns if col not in self.rolling_columns]
+        usecols = set(row_columns) | set(self.buffer_columns)
+        
+        dtypes = {col: np.float64 for col in usecols}
+        dtypes.update({'team': 'str', 'team_opp': 'str', 'date': 'str', 'season': 'int64', 'home': 'int64', 'won': 'bool'})
+        dtypes = {col: dtype for col, dtype in dtypes.items() if col in usecols}
+        
+        buffer_size = max(self.rolling_windows)
+        self.team_buffers = {}
+        last_dates = {}
+        latest = None
+        total_rows = 0
+        
+        reader = pd.read_csv(nba_games_path, usecols=lambda col: col in usecols, dtype=dtypes, chunksize=chunksize)
+        for chunk in reader:
+            chunk['date'] = pd.to_datetime(chunk['date'])
+            if 'won' in chunk.columns:
+                chunk['won'] = chunk['won'].astype(float)
+            total_rows += len(chunk)
+            
+            dates = chunk['date'].to_numpy()
+            raw = chunk[self.buffer_columns].to_numpy(dtype=np.float64)
+            for team, positions in chunk.groupby('team', sort=False).indices.items():
+                team_dates = dates[positions]
+                previous = last_dates.get(team, team_dates[0])
+                if team_dates[0] < previous or (np.diff(team_dates) < np.timedelta64(0)).any():
+                    raise ValueError(f"{team} games in {nba_games_path} are not in date order; "
+                                     "load it without streaming")
+                last_dates[team] = team_dates[-1]
+                
+                if self.buffer_columns:
+                    buffer = self.team_buffers.setdefault(team, deque(maxlen=buffer_size))
+                    buffer.extend(raw[positions[-buffer_size:]])
+            
+            # Carry each team's latest row forward; everything older leaves with the chunk
+            tails = chunk.groupby('team', sort=False).tail(1)[row_columns]
+            latest = tails if latest is None else pd.concat([latest, tails], ignore_index=True)
+            latest = latest.groupby('team', sort=False).tail(1)
+        
+        if latest is None:
+            raise ValueError(f"No games found in {nba_games_path}")
+        
+        # Rolling columns for each team's latest game come straight from its ring buffer
+        latest = latest.sort_values('team', kind='stable').reset_index(drop=True)
+        rolled = np.full((len(latest), len(self.rolling_columns)), np.nan)
+        raw_positions = self.rolling_positions()
+        for i, team in enumerate(latest['team']):
+            if team in self.team_buffers:
+                self.roll_buffer(self.team_buffers[team], raw_positions, rolled[i])
+        
+        # Left in float64 until the team index is built, then shrunk like compact()
+        self.df = pd.concat([latest, pd.DataFrame(rolled, columns=list(self.rolling_columns))], axis=1)[columns]
+        self.lean = True
+        print(f"🪶 Streamed {total_rows} games into {len(self.df)} team rows "
+              f"({len(usecols)} of {len(file_columns)} columns parsed)")
     
     def remove_usage_columns(self):
         """Remove all usage rate related columns"""
@@ -31,21 +347,13 @@ class NBAFeatureExtractor:
         print(f"Remaining columns: {len(self.df.columns)}")
     
     def create_rolling_features(self):
-        """Create rolling 10-game averages for clean numeric features"""
-        print("📊 Creating rolling 10-game averages...")
-        
-        # Core basketball stats that are always numeric
-        core_features = [
-            'fg', 'fga', 'fg%', '3p', '3pa', '3p%', 'ft', 'fta', 'ft%',
-            'orb', 'drb', 'trb', 'ast', 'stl', 'blk', 'tov', 'pf', 'pts',
-            'ts%', 'efg%', '+/-'
-        ]
+        """Create rolling averages for clean numeric features in a single pass"""
+        windows = ', '.join(str(w) for w in self.rolling_windows)
+        print(f"📊 Creating rolling {windows}-game averages...")
         
-        # Only use features that actually exist and are numeric
-        available_features = []
-        for feature in core_features:
-            if feature in self.df.columns and pd.api.types.is_numeric_dtype(self.df[feature]):
-                available_features.append(feature)
+        available_features, max_features, opp_features = rolling_sources(
+            self.df.columns, lambda col: pd.api.types.is_numeric_dtype(self.df[col])
+        )
         
         print(f"Creating rolling averages for {len(available_features)} features")
         
@@ -54,142 +362,463 @@ class NBAFeatureExtractor:
             self.df['won'] = self.df['won'].astype(float)
             available_features.append('won')
         
-        # Create rolling averages
-        for feature in available_features:
-            self.df[f'{feature}_10_x'] = (
-                self.df.groupby('team')[feature]
-                .rolling(10, min_periods=1)
-                .mean()
-                .reset_index(0, drop=True)
-            )
-        
-        # Rolling for max player stats (only numeric ones)
-        max_features = []
-        for col in self.df.columns:
-            if col.endswith('_max') and not col.endswith('_opp') and pd.api.types.is_numeric_dtype(self.df[col]):
-                if 'usg' not in col.lower():  # Skip any remaining usage stats
-                    max_features.append(col)
-        
         print(f"Creating rolling averages for {len(max_features)} max features")
+        print(f"Creating rolling averages for {len(opp_features)} opponent features")
         
-        for feature in max_features:
-            self.df[f'{feature}_10_x'] = (
-                self.df.groupby('team')[feature]
-                .rolling(10, min_periods=1)
-                .mean()
-                .reset_index(0, drop=True)
-            )
-        
-        # Rolling for opponent stats (clean numeric only)
-        opp_features = []
-        for col in self.df.columns:
-            if col.endswith('_opp') and not col.endswith('_max_opp') and pd.api.types.is_numeric_dtype(self.df[col]):
-                if 'usg' not in col.lower():
-                    opp_features.append(col)
+        # One 2-D block for every selected column, rolled per team segment at once
+        features = available_features + max_features + opp_features
+        values = self.df[features].to_numpy(dtype=np.float64)
+        team_codes = self.df['team'].to_numpy()
+        segment_starts = np.flatnonzero(np.r_[True, team_codes[1:] != team_codes[:-1]])
         
-        print(f"Creating rolling averages for {len(opp_features)} opponent features")
+        rolled = {}
+        for window, means in rolling_means(values, segment_starts, self.rolling_windows).items():
+            for i, feature in enumerate(features):
+                rolled[f'{feature}_{window}_x'] = means[:, i]
         
-        for feature in opp_features:
-            base_name = feature.replace('_opp', '')
-            self.df[f'{base_name}_opp_10_x'] = (
-                self.df.groupby('team')[feature]
-                .rolling(10, min_periods=1)
-                .mean()
-                .reset_index(0, drop=True)
-            )
+        # Assign all rolling columns in one concat instead of one insert each
+        self.df = pd.concat([self.df, pd.DataFrame(rolled, index=self.df.index)], axis=1)
         
         print("✅ Rolling features created successfully")
     
-    def get_team_features(self, team, opponent, is_home=True):
-        """Extract available features for a team vs opponent matchup"""
+    def find_rolling_columns(self):
+        """Map each rolling column in the frame to its (raw column, window)"""
+        rolling_columns = {}
+        for col in self.df.columns:
+            for window in self.rolling_windows:
+                suffix = f'_{window}_x'
+                if col.endswith(suffix) and col[:-len(suffix)] in self.df.columns:
+                    rolling_columns[col] = (col[:-len(suffix)], window)
+        return rolling_columns
+    
+    def compact(self):
+        """Shrink the frame to what serving needs and report the memory saved
+        
+        Keeps the key columns plus the model's feature sources, downcasts
+        floats to float32, stores team codes as categoricals and, once the
+        ring buffers have captured recent history, drops every row but each
+        team's latest. Training-set builds need the full history, so they
+        are unavailable afterwards.
+        """
+        self.consolidate()
+        before = self.df.memory_usage(deep=True).sum()
+        
+        # Only the rolling columns the model reads need ring buffers
+        self.build_ring_buffers(only=self.feature_columns)
+        
+        columns = [col for col in KEY_COLUMNS if col in self.df.columns]
+        columns += [col for col in dict.fromkeys(self.feature_columns) if col is not None and col not in columns]
+        
+        latest = self.df.groupby('team', sort=False, observed=True).tail(1)[columns].reset_index(drop=True)
+        self.df = shrink_frame(latest)
+        self.lean = True
+        
+        after = self.df.memory_usage(deep=True).sum()
+        self.memory_footprint = {'before_bytes': int(before), 'after_bytes': int(after)}
+        print(f"🪶 Lean mode: frame {before / 1e6:.1f} MB -> {after / 1e6:.3f} MB "
+              f"({len(columns)} columns, {len(self.df)} rows)")
+    
+    def build_ring_buffers(self, only=None):
+        """Keep each team's last games of raw stats for incremental rolling updates
+        
+        only limits the buffers to the raw stats behind the given rolling columns.
+        """
+        self.consolidate()
+        self.rolling_columns = self.find_rolling_columns()
+        if only is not None:
+            self.rolling_columns = {col: source for col, source in self.rolling_columns.items() if col in only}
+        self.buffer_columns = list(dict.fromkeys(raw for raw, _ in self.rolling_columns.values()))
+        buffer_size = max(self.rolling_windows)
+        
+        self.team_buffers = {}
+        if not self.buffer_columns:
+            return
+        
+        recent = self.df.groupby('team', sort=False, observed=True).tail(buffer_size)
+        values = recent[self.buffer_columns].to_numpy(dtype=np.float64)
+        for team, positions in recent.groupby('team', sort=False, observed=True).indices.items():
+            self.team_buffers[team] = deque(values[positions], maxlen=buffer_size)
+    
+    def append_games(self, new_rows):
+        """Absorb newly played games without rebuilding the extractor
+        
+        new_rows holds raw game rows in the nba_games.csv layout (a DataFrame
+        or a list of dicts). Only the teams involved have their rolling
+        columns extended from their ring buffers and their index entries
+        refreshed. Rows that are not newer than the team's latest game are
+        skipped. With full history the rows are queued and only merged into
+        the sorted frame when old games are next read (see consolidate), so
+        ingesting costs the same however long the history is. Nothing is
+        written back to disk.
+        
+        Returns the number of rows ingested.
+        """
+        new_df = pd.DataFrame(new_rows)
+        if len(new_df) == 0:
+            return 0
+        
+        missing = [col for col in ('team', 'team_opp', 'date') if col not in new_df.columns]
+        if missing:
+            raise ValueError(f"New games are missing required columns: {missing}")
+        
+        new_df['date'] = pd.to_datetime(new_df['date'])
+        new_df = new_df.sort_values(['team', 'date'], kind='stable').reset_index(drop=True)
+        if 'won' in new_df.columns:
+            new_df['won'] = new_df['won'].astype(float)
+        
+        with self.ingest_lock:
+            # Nothing is committed until the whole batch has converted, so a bad
+            # row leaves latest_dates, the ring buffers and the frame untouched
+            accepted = []
+            batch_latest = {}
+            for i, (team, date) in enumerate(zip(new_df['team'], new_df['date'])):
+                latest = batch_latest.get(team, self.latest_dates.get(team))
+                if latest is not None and date <= latest:
+                    continue
+                batch_latest[team] = date
+                accepted.append(i)
+            
+            if not accepted:
+                return 0
+            new_df = new_df.loc[accepted].reset_index(drop=True)
+            
+            # Push raw stats through copies of each team's ring buffer to extend its rolling columns
+            raw = new_df.reindex(columns=self.buffer_columns).to_numpy(dtype=np.float64)
+            rolling_names = list(self.rolling_columns)
+            raw_positions = self.rolling_positions()
+            
+            rolled = np.empty((len(new_df), len(rolling_names)))
+            buffer_size = max(self.rolling_windows)
+            buffers = {}
+            for i, team in enumerate(new_df['team']):
+                if team not in buffers:
+                    buffers[team] = deque(self.team_buffers.get(team, ()), maxlen=buffer_size)
+                buffer = buffers[team]
+                buffer.append(raw[i])
+                self.roll_buffer(buffer, raw_positions, rolled[i])
+            
+            new_df = pd.concat([
+                new_df.drop(columns=rolling_names, errors='ignore'),
+                pd.DataFrame(rolled, columns=rolling_names)
+            ], axis=1)
+            
+            # Keep only the columns this extractor already tracks, in its dtypes
+            new_df = new_df.reindex(columns=self.df.columns)
+            dtypes = self.df.dtypes
+            categorical = [col for col in self.df.columns if isinstance(dtypes[col], pd.CategoricalDtype)]
+            new_dtypes = new_df.dtypes
+            new_df = new_df.astype({
+                col: dtype for col, dtype in dtypes.items()
+                if dtype != new_dtypes[col] and pd.api.types.is_float_dtype(dtype)
+            })
+            
+            # New rows are each team's latest game, so they feed the index directly
+            latest = new_df.groupby('team', sort=False).tail(1)
+            index_rows = [np.ascontiguousarray(row) for row in self.feature_rows(latest)]
+            
+            if self.lean:
+                combined = pd.concat([self.df, new_df], ignore_index=True)
+                for col in categorical:
+                    combined[col] = combined[col].astype('category')
+                combined = combined.sort_values(['team', 'date'], kind='stable')
+                self.df = combined.groupby('team', sort=False, observed=True).tail(1).reset_index(drop=True)
+            else:
+                # Re-sorting the whole history here would make every ingest O(history);
+                # the rows wait until something reads old games (see consolidate)
+                self.pending_games.append(new_df)
+            
+            self.latest_dates.update(batch_latest)
+            self.team_buffers.update(buffers)
+            for team, row in zip(latest['team'], index_rows):
+                self.team_index[team] = row
+            self.data_version += 1
+        
+        print(f"📥 Ingested {len(new_df)} new games for {new_df['team'].nunique()} teams")
+        return len(new_df)
+    
+    def consolidate(self):
+        """Merge games queued by append_games into the frame, sorted by team then date
+        
+        Returns (frame, data version), read together under the ingest lock so
+        a caller never pairs a version with a frame that lacks its games.
+        """
+        with self.ingest_lock:
+            if self.pending_games:
+                dtypes = self.df.dtypes
+                categorical = [col for col in self.df.columns if isinstance(dtypes[col], pd.CategoricalDtype)]
+                combined = pd.concat([self.df, *self.pending_games], ignore_index=True)
+                for col in categorical:
+                    combined[col] = combined[col].astype('category')
+                self.df = combined.sort_values(['team', 'date'], kind='stable').reset_index(drop=True)
+                self.pending_games = []
+            return self.df, self.data_version
+    
+    def rolling_positions(self):
+        """Group rolling columns by window as (column positions, ring buffer positions)"""
+        raw_positions = {window: ([], []) for window in self.rolling_windows}
+        for j, (raw_col, window) in enumerate(self.rolling_columns.values()):
+            raw_positions[window][0].append(j)
+            raw_positions[window][1].append(self.buffer_columns.index(raw_col))
+        return raw_positions
+    
+    def roll_buffer(self, buffer, raw_positions, out):
+        """Write a team's rolling columns, computed from its ring buffer, into out"""
+        history = np.array(buffer)
+        for window, (targets, sources) in raw_positions.items():
+            out[targets] = window_means(history, window)[sources]
+    
+    def resolve_feature_columns(self, available=None):
+        """Pick the source column (or None for the default) of every predictor
+        
+        available defaults to the frame's columns.
+        """
+        if available is None:
+            available = self.df.columns
+        columns = []
+        for name in PREDICTORS:
+            _, candidates, _ = FEATURE_SOURCES[name]
+            columns.append(next((col for col in candidates if col in available), None))
+        return columns
+    
+    def feature_rows(self, rows):
+        """Build 22-slot feature vectors from a frame of team rows
+        
+        Team slots hold the row's values as the team, opponent slots its
+        values as the opponent, so a matchup only has to pick slots.
+        """
+        matrix = np.empty((len(rows), len(PREDICTORS)), dtype=np.float64)
+        for i, (name, col) in enumerate(zip(PREDICTORS, self.feature_columns)):
+            if col is None:
+                matrix[:, i] = FEATURE_SOURCES[name][2]
+            else:
+                matrix[:, i] = rows[col].to_numpy(dtype=np.float64)
+        return matrix
+    
+    def build_team_index(self):
+        """Cache each team's latest feature vector, keyed by team code"""
+        self.feature_columns = self.resolve_feature_columns()
+        
+        # Rows are sorted by team then date, so the last row is the latest game
+        latest = self.df.groupby('team', sort=False, observed=True).tail(1)
+        matrix = self.feature_rows(latest)
         
-        # Get recent games for both teams
-        team_games = self.df[self.df['team'] == team].tail(5)
-        opp_games = self.df[self.df['team'] == opponent].tail(5)
+        self.team_index = {
+            team: np.ascontiguousarray(matrix[i])
+            for i, team in enumerate(latest['team'])
+        }
         
-        if len(team_games) == 0 or len(opp_games) == 0:
-            print(f"⚠️ No recent games found for {team} or {opponent}")
+        # Kept up to date by append_games, which uses it to skip games it already has
+        self.latest_dates = dict(zip(latest['team'], latest['date']))
+        
+        # Bumped whenever indexed features change so callers can key caches on it
+        self.data_version += 1
+        print(f"📇 Indexed latest features for {len(self.team_index)} teams")
+    
+    def refresh_team(self, team):
+        """Rebuild a single team's index entry after new games come in"""
+        df, _ = self.consolidate()
+        team_games = df[df['team'] == team]
+        
+        # Bump the version only once the new entry is in place, so nothing can
+        # cache a result built from the old row under the new version
+        if len(team_games) == 0:
+            self.team_index.pop(team, None)
+            self.latest_dates.pop(team, None)
+            self.data_version += 1
             return None
         
-        # Use most recent game's rolling averages
-        latest_team = team_games.iloc[-1]
-        latest_opp = opp_games.iloc[-1]
-        
-        features = {}
-        
-        # Basic team stats
-        features['fga'] = latest_team.get('fga', 85.0)
-        features['fg_opp'] = latest_opp.get('fg', 40.0)
-        features['orb_opp'] = latest_opp.get('orb', 10.0)
-        features['stl%_opp'] = latest_opp.get('stl%', 0.08)
-        features['pf_max_opp'] = latest_opp.get('pf_max', 6.0)
-        features['orb%_max_opp'] = latest_opp.get('orb%_max', 0.15)
-        
-        # Rolling features that exist (avoiding usage rates)
-        features['efg%_10_x'] = latest_team.get('efg%_10_x', latest_team.get('efg%', 0.52))
-        features['fg_max_10_x'] = latest_team.get('fg_max_10_x', latest_team.get('fg_max', 15.0))
-        features['+/-_max_10_x'] = latest_team.get('+/-_max_10_x', latest_team.get('+/-_max', 5.0))
-        features['trb%_max_10_x'] = latest_team.get('trb%_max_10_x', latest_team.get('trb%_max', 0.25))
-        
-        # Rolling opponent features
-        features['blk_opp_10_x'] = latest_team.get('blk_opp_10_x', latest_team.get('blk_opp', 5.0))
-        features['drb%_opp_10_x'] = latest_team.get('drb%_opp_10_x', latest_team.get('drb%_opp', 0.75))
-        features['ft%_max_opp_10_x'] = latest_team.get('ft%_max_opp_10_x', latest_team.get('ft%_max_opp', 0.8))
-        features['+/-_max_opp_10_x'] = latest_team.get('+/-_max_opp_10_x', latest_team.get('+/-_max_opp', -5.0))
-        features['efg%_max_opp_10_x'] = latest_team.get('efg%_max_opp_10_x', latest_team.get('efg%_max_opp', 0.55))
-        
-        # Home court advantage
-        features['home_next'] = 1 if is_home else 0
-        
-        # Team Y features (opponent perspective)
-        features['mp_10_y'] = latest_opp.get('mp_10_x', 240.0)
-        features['gmsc_max_10_y'] = latest_opp.get('gmsc_max_10_x', latest_opp.get('gmsc_max', 15.0))
-        features['blk%_opp_10_y'] = latest_opp.get('blk%_opp_10_x', latest_opp.get('blk%_opp', 0.06))
-        features['ft%_max_opp_10_y'] = latest_opp.get('ft%_max_opp_10_x', latest_opp.get('ft%_max_opp', 0.8))
-        features['ast_max_opp_10_y'] = latest_opp.get('ast_max_opp_10_x', latest_opp.get('ast_max_opp', 8.0))
-        features['+/-_max_opp_10_y'] = latest_opp.get('+/-_max_opp_10_x', latest_opp.get('+/-_max_opp', -3.0))
+        row = np.ascontiguousarray(self.feature_rows(team_games.tail(1))[0])
+        self.latest_dates[team] = team_games['date'].iloc[-1]
+        self.team_index[team] = row
+        self.data_version += 1
+        return row
+    
+    def get_feature_vector(self, team, opponent, is_home=True, as_of=None):
+        """Combine two teams into a feature vector in model order
+        
+        Uses each team's latest game, or with as_of set, each team's latest
+        game strictly before that date.
+        """
+        if as_of is None:
+            team_row = self.team_index.get(team)
+            opp_row = self.team_index.get(opponent)
+        else:
+            (team_row, opp_row), found = self.rows_as_of([team, opponent], [as_of, as_of])
+            if not found.all():
+                team_row = opp_row = None
+        
+        if team_row is None or opp_row is None:
+            # Request path, so this goes through logging rather than print
+            logger.debug("No games found for %s or %s (as of %s)", team, opponent, as_of or 'latest')
+            return None
         
+        features = np.where(OPPONENT_MASK, opp_row, team_row)
+        features[HOME_SLOT] = 1 if is_home else 0
         return features
     
-    def get_prediction_features(self, home_team, away_team):
-        """Get features in order the model expects (excluding usage rates)"""
-        
-        # Get features for home team vs away team
-        feature_dict = self.get_team_features(home_team, away_team, is_home=True)
+    def get_team_features(self, team, opponent, is_home=True, as_of=None):
+        """Extract available features for a team vs opponent matchup"""
+        features = self.get_feature_vector(team, opponent, is_home, as_of)
         
-        if feature_dict is None:
+        if features is None:
             return None
         
-        # Create a list of available features (no usage rates)
-        available_features = [
-            'fga', 'fg_opp', 'orb_opp', 'stl%_opp', 'pf_max_opp', 'orb%_max_opp',
-            'efg%_10_x', 'fg_max_10_x', '+/-_max_10_x', 'trb%_max_10_x', 'blk_opp_10_x',
-            'drb%_opp_10_x', 'ft%_max_opp_10_x', '+/-_max_opp_10_x', 'efg%_max_opp_10_x',
-            'home_next', 'mp_10_y', 'gmsc_max_10_y', 'blk%_opp_10_y',
-            'ft%_max_opp_10_y', 'ast_max_opp_10_y', '+/-_max_opp_10_y'
-        ]
+        return dict(zip(PREDICTORS, features.tolist()))
+    
+    def get_prediction_features(self, home_team, away_team, as_of=None):
+        """Get features in order the model expects (excluding usage rates)"""
+        features = self.get_feature_vector(home_team, away_team, is_home=True, as_of=as_of)
         
-        # Return features in order
-        features = []
-        for feature_name in available_features:
-            if feature_name in feature_dict:
-                features.append(feature_dict[feature_name])
-            else:
-                # Reasonable defaults based on NBA averages
-                if 'fg%' in feature_name:
-                    features.append(0.45)
-                elif 'ft%' in feature_name:
-                    features.append(0.75)
-                elif '%' in feature_name:
-                    features.append(0.1)
-                elif feature_name == 'home_next':
-                    features.append(1)
-                elif feature_name == 'mp_10_y':
-                    features.append(240.0)
-                else:
-                    features.append(5.0)
+        if features is None:
+            return None
         
-        return features
+        return features.tolist()
+
+    def get_prediction_matrix(self, matchups, as_of=None):
+        """Stack features for many (home, away) matchups into one 2-D array
+        
+        Returns the matrix for the matchups whose teams are indexed plus the
+        positions of those rows in the input; unknown teams are skipped.
+        as_of, one date per matchup, scores each matchup as it stood before
+        that date instead of today.
+        """
+        if as_of is not None:
+            home_rows, home_found = self.rows_as_of([home for home, _ in matchups], as_of)
+            away_rows, away_found = self.rows_as_of([away for _, away in matchups], as_of)
+            rows = np.flatnonzero(home_found & away_found)
+            matrix = np.where(OPPONENT_MASK, away_rows[rows], home_rows[rows])
+            matrix[:, HOME_SLOT] = 1
+            return matrix, rows.tolist()
+        
+        rows = []
+        home_rows = []
+        away_rows = []
+        for i, (home_team, away_team) in enumerate(matchups):
+            home_row = self.team_index.get(home_team)
+            away_row = self.team_index.get(away_team)
+            if home_row is None or away_row is None:
+                continue
+            rows.append(i)
+            home_rows.append(home_row)
+            away_rows.append(away_row)
+        
+        if not rows:
+            return np.empty((0, len(PREDICTORS))), rows
+        
+        matrix = np.where(OPPONENT_MASK, np.stack(away_rows), np.stack(home_rows))
+        matrix[:, HOME_SLOT] = 1
+        return matrix, rows
+
+    def get_matchup_matrix(self, teams=None):
+        """Features for every home/away pairing of the given (or all indexed) teams
+        
+        Returns an (N*N, 22) matrix with row i*N + j holding teams[i] at home
+        against teams[j], diagonal included, alongside the team order used.
+        """
+        if teams is None:
+            teams = sorted(self.team_index)
+        teams = [team for team in teams if team in self.team_index]
+        
+        if not teams:
+            return np.empty((0, len(PREDICTORS))), teams
+        
+        rows = np.stack([self.team_index[team] for team in teams])
+        
+        # Home team varies along axis 0, away team along axis 1
+        matrix = np.where(OPPONENT_MASK, rows[np.newaxis, :, :], rows[:, np.newaxis, :])
+        matrix = matrix.reshape(len(teams) * len(teams), len(PREDICTORS))
+        matrix[:, HOME_SLOT] = 1
+        return matrix, teams
+
+    def build_date_index(self):
+        """Index every game row by (team, date) for point-in-time lookups
+        
+        Rows are sorted by team then date, so one sorted array of
+        (team code << 32) + day number holds every team's history in order
+        and a single searchsorted answers a whole batch of as-of queries.
+        """
+        if self.lean:
+            raise ValueError("Lean extractors drop game history; load without lean=True for as-of queries")
+        
+        # Frame and version come as a pair, so the index is never labelled with
+        # a version whose games it lacks
+        df, version = self.consolidate()
+        teams = df['team'].to_numpy()
+        starts = np.flatnonzero(np.r_[True, teams[1:] != teams[:-1]]) if len(teams) else np.empty(0, dtype=np.int64)
+        codes = np.repeat(np.arange(len(starts), dtype=np.int64), np.diff(np.r_[starts, len(teams)]))
+        days = df['date'].to_numpy().astype('datetime64[D]').astype(np.int64)
+        
+        self.date_index = {
+            'version': version,
+            'team_codes': {team: code for code, team in enumerate(teams[starts])},
+            'codes': codes,
+            'keys': (codes << 32) + days,
+            'features': self.feature_rows(df)
+        }
+        return self.date_index
+    
+    def rows_as_of(self, teams, dates):
+        """Feature rows of each team's latest game strictly before each date
+        
+        Returns (rows, found): rows[i] is valid only where found[i] is True,
+        i.e. teams[i] is known and played before dates[i]. Lookups are a
+        binary search each, so bulk historical queries stay cheap.
+        """
+        index = self.date_index
+        if index is None or index['version'] != self.data_version:
+            index = self.build_date_index()
+        
+        codes = np.array([index['team_codes'].get(team, -1) for team in teams], dtype=np.int64)
+        days = np.asarray(dates, dtype='datetime64[D]').astype(np.int64)
+        
+        positions = np.searchsorted(index['keys'], (codes << 32) + days, side='left') - 1
+        found = (codes >= 0) & (positions >= 0)
+        found[found] = index['codes'][positions[found]] == codes[found]
+        
+        if len(index['features']) == 0:
+            return np.empty((len(codes), len(PREDICTORS))), np.zeros(len(codes), dtype=bool)
+        return index['features'][np.maximum(positions, 0)], found
+    
+    def build_training_set(self, min_season=None):
+        """Point-in-time feature matrix and labels for every historical game
+        
+        Each game is described by both teams' rolling features as of their
+        previous game, so nothing from the game itself (or later) leaks in.
+        Games where either team has no earlier game are skipped.
+        """
+        if self.lean:
+            raise ValueError("Lean extractors drop game history; load without lean=True to build training sets")
+        
+        df, _ = self.consolidate()
+        rows = self.feature_rows(df)
+        positions = np.arange(len(df))
+        
+        # Rows are sorted by team then date, so the previous game sits one row up
+        has_previous = df.groupby('team', sort=False, observed=True).cumcount().to_numpy() > 0
+        previous = np.where(has_previous, positions - 1, -1)
+        
+        # Locate the opponent's row for the same game, then step back one game
+        game_rows = pd.Series(positions, index=pd.MultiIndex.from_arrays([df['team'], df['date']]))
+        game_rows = game_rows[~game_rows.index.duplicated(keep='last')]
+        opp_rows = game_rows.reindex(pd.MultiIndex.from_arrays([df['team_opp'], df['date']]))
+        opp_rows = opp_rows.fillna(-1).to_numpy(dtype=np.int64)
+        opp_previous = np.full(len(df), -1)
+        found = opp_rows >= 0
+        opp_previous[found] = previous[opp_rows[found]]
+        
+        keep = (previous >= 0) & (opp_previous >= 0)
+        if min_season is not None:
+            keep &= df['season'].to_numpy() >= min_season
+        
+        X = np.where(OPPONENT_MASK, rows[opp_previous[keep]], rows[previous[keep]])
+        if 'home' in df.columns:
+            X[:, HOME_SLOT] = df['home'].to_numpy(dtype=np.float64)[keep]
+        else:
+            X[:, HOME_SLOT] = 1
+        
+        y = df['won'].to_numpy()[keep].astype(int)
+        seasons = df['season'].to_numpy()[keep]
+        return X, y, seasons
 
 # Test the feature extractor
 if __name__ == "__main__":
@@ -202,14 +831,6 @@ if __name__ == "__main__":
     print(f"Sample: {features[:10]}")
     
     # Show feature names and values
-    available_features = [
-        'fga', 'fg_opp', 'orb_opp', 'stl%_opp', 'pf_max_opp', 'orb%_max_opp',
-        'efg%_10_x', 'fg_max_10_x', '+/-_max_10_x', 'trb%_max_10_x', 'blk_opp_10_x',
-        'drb%_opp_10_x', 'ft%_max_opp_10_x', '+/-_max_opp_10_x', 'efg%_max_opp_10_x',
-        'home_next', 'mp_10_y', 'gmsc_max_10_y', 'blk%_opp_10_y',
-        'ft%_max_opp_10_y', 'ast_max_opp_10_y', '+/-_max_opp_10_y'
-    ]
-    
     print(f"\n📊 Feature breakdown:")
-    for i, (name, value) in enumerate(zip(available_features, features)):
+    for i, (name, value) in enumerate(zip(PREDICTORS, features)):
         print(f"{i+1:2d}. {name:<20}: {value:.3f}")
\ No newline at end of file
@@ -0,0 +1,106 @@
+import hashlib
+import json
+import os
+import numpy as np
+import pandas as pd
+
+# Bump when the on-disk layout changes so old stores get rebuilt
+STORE_VERSION = 1
+
+# Columns every store keeps besides the model's feature sources
+KEY_COLUMNS = ['team', 'team_opp', 'date', 'season', 'home', 'won']
+
+def file_checksum(path, chunk_size=1 << 20):
+    """MD5 of a file, read in chunks so large CSVs don't sit in memory"""
+    digest = hashlib.md5()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def write_feature_store(df, columns, store_dir, source_checksum, inputs=None, required_columns=()):
+    """Write the given columns of a processed games frame as one .npy file each
+
+    Team codes become int16 category codes, dates int64 nanoseconds, integer
+    columns keep a small integer type and everything else is float32.
+    inputs records what else the frame was built from (see
+    load_feature_store); required_columns lists the columns a reader
+    cannot do without. The manifest is written last, so a half-written
+    store is never loaded.
+    """
+    os.makedirs(store_dir, exist_ok=True)
+    manifest_path = os.path.join(store_dir, 'manifest.json')
+    if os.path.exists(manifest_path):
+        os.remove(manifest_path)
+
+    entries = []
+    for i, col in enumerate(columns):
+        values = df[col]
+        entry = {'name': col, 'file': f'col_{i:03d}.npy'}
+
+        if col in ('team', 'team_opp'):
+            categorical = pd.Categorical(values)
+            entry['kind'] = 'category'
+            entry['categories'] = [str(c) for c in categorical.categories]
+            data = categorical.codes.astype(np.int16)
+        elif pd.api.types.is_datetime64_any_dtype(values):
+            entry['kind'] = 'datetime'
+            data = values.to_numpy(dtype='datetime64[ns]').view(np.int64)
+        elif pd.api.types.is_integer_dtype(values) or pd.api.types.is_bool_dtype(values):
+            entry['kind'] = 'int'
+            data = values.to_numpy().astype(np.int16)
+        else:
+            entry['kind'] = 'float'
+            data = values.to_numpy(dtype=np.float32)
+
+        np.save(os.path.join(store_dir, entry['file']), np.ascontiguousarray(data))
+        entries.append(entry)
+
+    manifest = {
+        'version': STORE_VERSION,
+        'source_checksum': source_checksum,
+        'inputs': inputs,
+        'required_columns': list(required_columns),
+        'rows': len(df),
+        'columns': entries
+    }
+    tmp_path = manifest_path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, manifest_path)
+
+def load_feature_store(store_dir, source_checksum=None, inputs=None):
+    """Memory-map a feature store back into a DataFrame
+
+    Returns None when the store is missing, from another layout version,
+    built from a different source file (checksum mismatch) or from other
+    inputs, or lacks one of its required columns.
+    """
+    manifest_path = os.path.join(store_dir, 'manifest.json')
+    if not os.path.exists(manifest_path):
+        return None
+
+    with open(manifest_path) as f:
+        manifest = json.load(f)
+
+    if manifest.get('version') != STORE_VERSION:
+        return None
+    if source_checksum is not None and manifest.get('source_checksum') != source_checksum:
+        return None
+    if inputs is not None and manifest.get('inputs') != inputs:
+        return None
+    stored = {entry['name'] for entry in manifest['columns']}
+    if any(col not in stored for col in manifest.get('required_columns', [])):
+        return None
+
+    columns = {}
+    for entry in manifest['columns']:
+        data = np.load(os.path.join(store_dir, entry['file']), mmap_mode='r')
+        if entry['kind'] == 'category':
+            columns[entry['name']] = pd.Categorical.from_codes(np.asarray(data), entry['categories'])
+        elif entry['kind'] == 'datetime':
+            columns[entry['name']] = data.view('datetime64[ns]')
+        else:
+            columns[entry['name']] = data
+
+    return pd.DataFrame(columns, copy=False)
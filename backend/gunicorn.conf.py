@@ -0,0 +1,36 @@
+# gunicorn -c gunicorn.conf.py
+#
+# The master imports app.py once (preload), exports the per-team feature
+# matrix and team stats table to shared memory, and forks workers that map
+# those tables read-only instead of each building their own copy.
+import gc
+import multiprocessing
+import os
+from shared_tables import attach_tables, export_tables, remove_tables
+
+wsgi_app = 'app:app'
+bind = os.environ.get('BIND', '0.0.0.0:3001')
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count()))
+preload_app = True
+
+# Set in the master by when_ready and inherited by every forked worker
+shared_tables_dir = None
+
+def when_ready(server):
+    global shared_tables_dir
+    service = server.app.wsgi().extensions['nba']
+    shared_tables_dir = export_tables(service.extractor, service.team_stats)
+
+    # Objects built so far are never collected; keeping the collector off
+    # them stops it from dirtying (and so copying) the shared pages
+    gc.freeze()
+
+def post_fork(server, worker):
+    service = worker.app.wsgi().extensions['nba']
+    if shared_tables_dir is not None:
+        attach_tables(service.extractor, service.team_stats, shared_tables_dir)
+    service.registry.after_fork()
+
+def on_exit(server):
+    if shared_tables_dir is not None:
+        remove_tables(shared_tables_dir)
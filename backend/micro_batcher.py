@@ -0,0 +1,78 @@
+import asyncio
+from metrics import metrics
+
+batch_size = metrics.histogram('nba_micro_batch_size', 'Distinct matchups scored per micro-batch',
+                               buckets=(1, 2, 4, 8, 16, 32, 64, 128, 256))
+coalesced_count = metrics.counter('nba_coalesced_requests_total', 'Requests that joined an identical pending or in-flight computation')
+
+class MicroBatcher:
+    """Collect concurrent requests into batches scored on a bounded executor
+
+    Requests for a key that is already pending or being computed share that
+    computation's result. New keys wait up to max_delay seconds (or until
+    max_batch_size keys are pending) and are then handed to `score` as one
+    list. At most max_in_flight batches run at once; while they do, new
+    arrivals keep accumulating into the next batch instead of queueing up
+    one executor job each.
+    """
+
+    def __init__(self, score, executor, max_batch_size=64, max_delay=0.002, max_in_flight=4):
+        self.score = score
+        self.executor = executor
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self.max_in_flight = max_in_flight
+        self.pending = {}
+        self.in_flight = {}
+        self.flush_timer = None
+        self.slots = None
+
+    async def submit(self, key):
+        """Result of score([..., key, ...]) for this key"""
+        loop = asyncio.get_running_loop()
+        if self.slots is None:
+            self.slots = asyncio.Semaphore(self.max_in_flight)
+
+        future = self.pending.get(key) or self.in_flight.get(key)
+        if future is not None:
+            coalesced_count.inc()
+        else:
+            future = loop.create_future()
+            self.pending[key] = future
+            if len(self.pending) >= self.max_batch_size:
+                self.flush()
+            elif self.flush_timer is None:
+                self.flush_timer = loop.call_later(self.max_delay, self.flush)
+
+        # A disconnecting client must not cancel the computation others wait on
+        return await asyncio.shield(future)
+
+    def flush(self):
+        if self.flush_timer is not None:
+            self.flush_timer.cancel()
+            self.flush_timer = None
+        asyncio.get_running_loop().create_task(self.run_batch())
+
+    async def run_batch(self):
+        async with self.slots:
+            # Take the batch only once a slot is free, so it includes late arrivals
+            keys = list(self.pending)[:self.max_batch_size]
+            if not keys:
+                return
+            batch = {key: self.pending.pop(key) for key in keys}
+            if self.pending:
+                self.flush()
+            self.in_flight.update(batch)
+
+            batch_size.observe(len(keys))
+            try:
+                results = await asyncio.get_running_loop().run_in_executor(self.executor, self.score, keys)
+            except Exception as e:
+                for future in batch.values():
+                    future.set_exception(e)
+            else:
+                for future, result in zip(batch.values(), results):
+                    future.set_result(result)
+            finally:
+                for key in keys:
+                    self.in_flight.pop(key, None)
@@ -0,0 +1,140 @@
+import hashlib
+import os
+import threading
+import time
+import numpy as np
+from numpy_scorer import load_scorer
+
+class ModelBundle:
+    """Immutable snapshot of one loaded model bundle"""
+
+    def __init__(self, model, scaler, predictors, version, path):
+        self.model = model
+        self.scaler = scaler
+        self.predictors = predictors
+        self.version = version
+        self.path = path
+
+def bundle_version(path):
+    """Short content hash identifying a bundle file"""
+    with open(path, 'rb') as f:
+        return hashlib.md5(f.read()).hexdigest()[:12]
+
+class ModelRegistry:
+    """Holds the live model bundle and swaps in retrained ones without a restart
+
+    Requests read `registry.current` once and use that snapshot throughout,
+    so a reload never changes the model under an in-flight request. New
+    bundles are loaded and validated in a background thread and only then
+    replace `current` with a single assignment.
+    """
+
+    def __init__(self, model_path, expected_predictors):
+        self.model_path = model_path
+        self.expected_predictors = list(expected_predictors)
+        self.current = None
+        self.last_error = None
+        self.reload_lock = threading.Lock()
+        self.listeners = []
+        self.watch_thread = None
+
+    def load_bundle(self, path):
+        """Load a bundle from disk and check it fits the extractor's features"""
+        version = bundle_version(path)
+        if path.endswith('.json'):
+            # Exported NumPy scorer: no scikit-learn (or scipy) import needed
+            bundle = load_scorer(path)
+        else:
+            import joblib
+            bundle = joblib.load(path)
+
+        predictors = list(bundle.get('predictors', []))
+        if predictors != self.expected_predictors:
+            raise ValueError(
+                f"Model predictors do not match the extractor's feature order "
+                f"({len(predictors)} vs {len(self.expected_predictors)} features)"
+            )
+
+        model = bundle['model']
+        scaler = bundle['scaler']
+
+        # Smoke-test the pair end to end before it can serve traffic
+        probe = np.zeros((1, len(predictors)))
+        model.predict_proba(scaler.transform(probe))
+
+        return ModelBundle(model, scaler, predictors, version, path)
+
+    def load(self):
+        """Load the bundle synchronously (used at startup)"""
+        self.current = self.load_bundle(self.model_path)
+        return self.current
+
+    def on_swap(self, callback):
+        """Call callback(bundle) whenever a new bundle goes live"""
+        self.listeners.append(callback)
+
+    def reload(self):
+        """Load and validate the bundle file, then swap it in if it changed
+
+        Returns True when a new bundle went live. A failed load keeps the
+        current bundle and records the error in last_error.
+        """
+        if not self.reload_lock.acquire(blocking=False):
+            return False
+
+        try:
+            try:
+                if self.current is not None and bundle_version(self.model_path) == self.current.version:
+                    return False
+                bundle = self.load_bundle(self.model_path)
+            except Exception as e:
+                self.last_error = str(e)
+                print(f"❌ Model reload failed, keeping current model: {e}")
+                return False
+
+            self.current = bundle
+            self.last_error = None
+            print(f"🔄 Model bundle {bundle.version} is now live")
+
+            for callback in self.listeners:
+                callback(bundle)
+            return True
+        finally:
+            self.reload_lock.release()
+
+    def reload_in_background(self):
+        """Start a reload without blocking the caller"""
+        thread = threading.Thread(target=self.reload, name='model-reload', daemon=True)
+        thread.start()
+        return thread
+
+    def watch(self, interval=10.0):
+        """Poll the bundle file's mtime and reload when it changes"""
+        if self.watch_thread is not None:
+            return
+        self.watch_interval = interval
+
+        def poll():
+            last_mtime = self.file_mtime()
+            while True:
+                time.sleep(interval)
+                mtime = self.file_mtime()
+                if mtime is not None and mtime != last_mtime:
+                    last_mtime = mtime
+                    self.reload()
+
+        self.watch_thread = threading.Thread(target=poll, name='model-watch', daemon=True)
+        self.watch_thread.start()
+
+    def after_fork(self):
+        """Reset thread state in a forked worker; the parent's threads don't survive fork"""
+        self.reload_lock = threading.Lock()
+        if self.watch_thread is not None:
+            self.watch_thread = None
+            self.watch(self.watch_interval)
+
+    def file_mtime(self):
+        try:
+            return os.stat(self.model_path).st_mtime_ns
+        except OSError:
+            return None
@@ -0,0 +1,108 @@
+import json
+import math
+import os
+import numpy as np
+
+# Bumped whenever the artifact layout changes
+SCORER_FORMAT = 1
+
+def expit(values):
+    """Logistic sigmoid, element by element through libm like scipy.special.expit
+
+    NumPy's vectorized exp can differ from libm in the last bit, which would
+    break exact parity with the scikit-learn bundle; prediction batches are
+    small, so the per-element loop costs little.
+    """
+    out = np.empty(len(values))
+    for i, value in enumerate(values.tolist()):
+        try:
+            out[i] = 1.0 / (1.0 + math.exp(-value))
+        except OverflowError:
+            out[i] = 0.0
+    return out
+
+class MinMaxTransform:
+    """MinMaxScaler.transform from its fitted min_ and scale_"""
+
+    def __init__(self, min_, scale_, clip=False, feature_range=(0, 1)):
+        self.min_ = np.asarray(min_, dtype=np.float64)
+        self.scale_ = np.asarray(scale_, dtype=np.float64)
+        self.clip = clip
+        self.feature_range = tuple(feature_range)
+
+    def transform(self, X):
+        # Same operations in the same order as scikit-learn, so results match bit for bit
+        X = np.array(X, dtype=np.float64)
+        X *= self.scale_
+        X += self.min_
+        if self.clip:
+            np.clip(X, self.feature_range[0], self.feature_range[1], out=X)
+        return X
+
+class LogisticModel:
+    """Binary LogisticRegression.predict_proba from its fitted coef_ and intercept_"""
+
+    def __init__(self, coef, intercept):
+        self.coef_ = np.asarray(coef, dtype=np.float64).reshape(1, -1)
+        self.intercept_ = np.asarray(intercept, dtype=np.float64).reshape(1)
+
+    def predict_proba(self, X):
+        scores = (np.asarray(X, dtype=np.float64) @ self.coef_.T + self.intercept_).ravel()
+        positive = expit(scores)
+        return np.vstack([1 - positive, positive]).T
+
+def export_scorer(model, scaler, predictors, path):
+    """Write a fitted MinMaxScaler + binary LogisticRegression as a JSON artifact
+
+    Floats are written with repr, which round-trips float64 exactly.
+    """
+    if len(model.classes_) != 2 or list(model.classes_) != [0, 1]:
+        raise ValueError(f"Only binary 0/1 models can be exported, got classes {list(model.classes_)}")
+
+    artifact = {
+        'format': SCORER_FORMAT,
+        'predictors': list(predictors),
+        'scaler': {
+            'min': scaler.min_.tolist(),
+            'scale': scaler.scale_.tolist(),
+            'clip': bool(getattr(scaler, 'clip', False)),
+            'feature_range': list(scaler.feature_range)
+        },
+        'model': {
+            'coef': model.coef_.ravel().tolist(),
+            'intercept': float(model.intercept_[0])
+        }
+    }
+
+    # Write then rename so a running API never loads a half-written artifact
+    with open(path + '.tmp', 'w') as f:
+        json.dump(artifact, f)
+    os.replace(path + '.tmp', path)
+    return artifact
+
+def load_scorer(path):
+    """Read an exported artifact as a bundle dict (model, scaler, predictors)"""
+    with open(path) as f:
+        artifact = json.load(f)
+
+    if artifact.get('format') != SCORER_FORMAT:
+        raise ValueError(f"Unsupported scorer format {artifact.get('format')} in {path}")
+
+    scaler = artifact['scaler']
+    return {
+        'model': LogisticModel(artifact['model']['coef'], artifact['model']['intercept']),
+        'scaler': MinMaxTransform(scaler['min'], scaler['scale'], scaler['clip'], scaler['feature_range']),
+        'predictors': artifact['predictors']
+    }
+
+def check_parity(model, scaler, scorer, X):
+    """Compare the exported scorer with the scikit-learn pair on X; raise on any difference"""
+    expected = model.predict_proba(scaler.transform(X))
+    actual = scorer['model'].predict_proba(scorer['scaler'].transform(X))
+    mismatches = int(np.sum(expected != actual))
+    if mismatches:
+        raise ValueError(
+            f"Exported scorer disagrees with the bundle on {mismatches} probabilities "
+            f"(max difference {np.max(np.abs(expected - actual)):.3g})"
+        )
+    return len(X)
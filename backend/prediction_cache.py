@@ -0,0 +1,64 @@
+import threading
+from collections import OrderedDict
+
+class PredictionCache:
+    """Bounded LRU cache of prediction responses
+
+    Keys are (home_team, away_team, model_version, data_version), so entries
+    built from an older model or older game data can never be served; clear()
+    drops them eagerly when either version changes.
+    """
+
+    def __init__(self, maxsize=4096):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, count_hit=True, count_miss=True):
+        """Return the cached response for key (marking it recently used) or None
+
+        Pre-checks that are followed by a counted lookup of the same key on a
+        miss pass count_miss=False, so each request is counted once.
+        """
+        with self.lock:
+            value = self.entries.get(key)
+            if value is None:
+                if count_miss:
+                    self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            if count_hit:
+                self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """Store a response, evicting the least recently used entries past maxsize"""
+        if self.maxsize <= 0:
+            return
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Drop every entry (counters are kept)"""
+        with self.lock:
+            self.entries.clear()
+
+    def stats(self):
+        """Hit/miss counters and current size"""
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self.entries),
+                'maxsize': self.maxsize,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0
+            }
@@ -0,0 +1,134 @@
+import argparse
+import json
+import os
+import sys
+import time
+import numpy as np
+from joblib import Memory, Parallel, delayed
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import accuracy_score, brier_score_loss, log_loss
+from sklearn.preprocessing import MinMaxScaler, StandardScaler
+
+# Add parent directory to path so we can import feature_extractor
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BACKEND_DIR)
+from feature_extractor import NBAFeatureExtractor
+from feature_store import file_checksum
+
+SCALERS = {'minmax': MinMaxScaler, 'standard': StandardScaler}
+
+# Model candidates compared fold by fold; the first matches train_model.py
+CANDIDATES = [
+    {'scaler': scaler, 'C': C}
+    for scaler in SCALERS
+    for C in (1.0, 0.01, 0.1, 10.0)
+]
+
+def feature_fingerprint():
+    """Checksum of feature_extractor.py, which defines the predictors and how they are built"""
+    return file_checksum(os.path.join(BACKEND_DIR, 'feature_extractor.py'))
+
+def build_training_set(games_path, checksum, features):
+    """Point-in-time features for every game in the file
+
+    Features only depend on games before each row, never on which seasons a
+    fold trains on, so one matrix serves every fold. `checksum` and
+    `features` (see feature_fingerprint) are part of the cache key and
+    invalidate it whenever the games file or the feature code changes.
+    """
+    extractor = NBAFeatureExtractor(games_path)
+    return extractor.build_training_set()
+
+def evaluate_fold(X, y, seasons, test_season, candidate):
+    """Train on seasons before test_season, score test_season"""
+    train = seasons < test_season
+    test = seasons == test_season
+
+    scaler = SCALERS[candidate['scaler']]()
+    model = LogisticRegression(C=candidate['C'], random_state=42, max_iter=1000)
+    model.fit(scaler.fit_transform(X[train]), y[train])
+    probabilities = model.predict_proba(scaler.transform(X[test]))[:, 1]
+
+    return {
+        'season': int(test_season),
+        'train_samples': int(train.sum()),
+        'test_samples': int(test.sum()),
+        'accuracy': float(accuracy_score(y[test], probabilities > 0.5)),
+        'log_loss': float(log_loss(y[test], probabilities, labels=[0, 1])),
+        'brier': float(brier_score_loss(y[test], probabilities))
+    }
+
+def summarize(folds):
+    """Pool fold metrics, weighting each season by its number of samples"""
+    weights = np.array([fold['test_samples'] for fold in folds])
+    return {
+        metric: float(np.average([fold[metric] for fold in folds], weights=weights))
+        for metric in ('accuracy', 'log_loss', 'brier')
+    }
+
+def run_backtest(games_path, min_train_seasons=1, n_jobs=-1, cache_dir=None, candidates=CANDIDATES):
+    """Walk-forward evaluation of every candidate on every season with enough history"""
+    memory = Memory(cache_dir, verbose=0)
+    build = memory.cache(build_training_set)
+
+    start = time.perf_counter()
+    X, y, seasons = build(games_path, file_checksum(games_path), feature_fingerprint())
+    print(f"📊 {len(X)} point-in-time samples ready in {time.perf_counter() - start:.2f}s")
+
+    all_seasons = np.unique(seasons)
+    test_seasons = all_seasons[min_train_seasons:]
+    if len(test_seasons) == 0:
+        raise ValueError(f"Need more than {min_train_seasons} seasons of games to backtest")
+
+    print(f"🔁 Walk-forward over seasons {list(map(int, test_seasons))} "
+          f"with {len(candidates)} candidates ({len(test_seasons) * len(candidates)} fits)")
+
+    start = time.perf_counter()
+    tasks = [(candidate, season) for candidate in candidates for season in test_seasons]
+    folds = Parallel(n_jobs=n_jobs)(
+        delayed(evaluate_fold)(X, y, seasons, season, candidate) for candidate, season in tasks
+    )
+    print(f"⏱️ Folds finished in {time.perf_counter() - start:.2f}s")
+
+    results = []
+    for i, candidate in enumerate(candidates):
+        candidate_folds = folds[i * len(test_seasons):(i + 1) * len(test_seasons)]
+        results.append({'candidate': candidate, 'overall': summarize(candidate_folds), 'folds': candidate_folds})
+
+    results.sort(key=lambda result: result['overall']['log_loss'])
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description='Season-by-season walk-forward backtest of model candidates')
+    parser.add_argument('--games', default=os.path.join(BACKEND_DIR, 'data', 'nba_games.csv'))
+    parser.add_argument('--min-train-seasons', type=int, default=1, help='seasons of history before the first scored season')
+    parser.add_argument('--n-jobs', type=int, default=-1, help='parallel fits (-1 uses every core)')
+    parser.add_argument('--cache-dir', default=os.path.join(BACKEND_DIR, 'data', 'backtest_cache'),
+                        help='where feature matrices are cached between runs')
+    parser.add_argument('--no-cache', action='store_true', help='rebuild features without touching the cache')
+    parser.add_argument('--output', help='write full results as JSON')
+    args = parser.parse_args()
+
+    print("🧪 BACKTESTING MODEL CANDIDATES...")
+    results = run_backtest(args.games, args.min_train_seasons, args.n_jobs,
+                           None if args.no_cache else args.cache_dir)
+
+    print(f"\n{'scaler':<10} {'C':>6} {'accuracy':>9} {'log loss':>9} {'brier':>7}")
+    for result in results:
+        candidate, overall = result['candidate'], result['overall']
+        print(f"{candidate['scaler']:<10} {candidate['C']:>6g} {overall['accuracy']:>9.1%} "
+              f"{overall['log_loss']:>9.4f} {overall['brier']:>7.4f}")
+
+    best = results[0]
+    print(f"\n🏆 Best by log loss: {best['candidate']}")
+    for fold in best['folds']:
+        print(f"   {fold['season']}: {fold['accuracy']:.1%} accuracy, log loss {fold['log_loss']:.4f}, "
+              f"brier {fold['brier']:.4f} ({fold['test_samples']} samples, trained on {fold['train_samples']})")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"💾 Results written to {args.output}")
+
+if __name__ == "__main__":
+    main()
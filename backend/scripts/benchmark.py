@@ -0,0 +1,205 @@
+import argparse
+import contextlib
+import json
+import os
+import platform
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import numpy as np
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BACKEND_DIR)
+sys.path.append(os.path.join(BACKEND_DIR, 'scripts'))
+
+# Named data sizes, in 82-game seasons of synthetic history
+SCALES = {'1x': 1, '5x': 5, '20x': 20}
+
+# Metrics where a bigger number is an improvement; everything else is a cost
+HIGHER_IS_BETTER = {'batch_predictions_per_s'}
+
+def peak_rss_mb():
+    """Peak resident set size of this process so far (ru_maxrss is KB on Linux)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+def percentiles(samples):
+    samples = np.asarray(samples) * 1000
+    return {'p50_ms': float(np.percentile(samples, 50)), 'p99_ms': float(np.percentile(samples, 99))}
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+def run_scale(seasons, workdir, repeats):
+    """Measure one data size inside a fresh process and return its metrics"""
+    from generate_synthetic_games import generate_games
+
+    # Lay out a throwaway backend directory: synthetic games, real stats and model
+    os.makedirs(os.path.join(workdir, 'data'), exist_ok=True)
+    os.makedirs(os.path.join(workdir, 'models'), exist_ok=True)
+    generate_games(seasons).to_csv(os.path.join(workdir, 'data', 'nba_games.csv'))
+    shutil.copy(os.path.join(BACKEND_DIR, 'data', 'team_stats.csv'), os.path.join(workdir, 'data'))
+    for name in ('simple_clean_model.pkl', 'simple_clean_model.json'):
+        if os.path.exists(os.path.join(BACKEND_DIR, 'models', name)):
+            shutil.copy(os.path.join(BACKEND_DIR, 'models', name), os.path.join(workdir, 'models'))
+    os.chdir(workdir)
+
+    # Measure the hot path, not the cache, and keep the watcher thread out of it
+    os.environ['PREDICTION_CACHE_SIZE'] = '0'
+    os.environ['MODEL_WATCH_INTERVAL'] = '0'
+
+    results = {'seasons': seasons}
+    quiet = contextlib.redirect_stdout(open(os.devnull, 'w'))
+
+    with quiet:
+        from feature_extractor import NBAFeatureExtractor
+        results['rss_after_imports_mb'] = peak_rss_mb()
+
+        extractor, results['cold_start_s'] = timed(NBAFeatureExtractor, 'data/nba_games.csv')
+        results['peak_rss_mb'] = peak_rss_mb()
+        results['games'] = len(extractor.df)
+
+        # First store-backed load writes the store, the second one maps it
+        NBAFeatureExtractor('data/nba_games.csv', store_path='data/feature_store')
+        _, results['store_start_s'] = timed(NBAFeatureExtractor, 'data/nba_games.csv', store_path='data/feature_store')
+
+        lean = NBAFeatureExtractor('data/nba_games.csv', lean=True)
+        results['frame_mb'] = lean.memory_footprint['before_bytes'] / 1e6
+        results['lean_frame_mb'] = lean.memory_footprint['after_bytes'] / 1e6
+        del lean
+
+        teams = sorted(extractor.team_index)
+        pairs = [(home, away) for home in teams for away in teams if home != away]
+
+        samples = []
+        for _ in range(repeats):
+            for home, away in pairs:
+                samples.append(timed(extractor.get_prediction_features, home, away)[1])
+        results['feature_extraction'] = percentiles(samples)
+
+        _, results['training_set_build_s'] = timed(extractor.build_training_set)
+        del extractor
+
+        import app as api
+        client = api.app.test_client()
+
+        samples = []
+        for _ in range(repeats):
+            for home, away in pairs:
+                response, elapsed = timed(client.post, '/api/predict', json={'home_team': home, 'away_team': away})
+                samples.append(elapsed)
+        results['predict_latency'] = percentiles(samples)
+
+        # A full 30x29 slate per batch request
+        batch = {'matchups': [{'home_team': home, 'away_team': away} for home, away in pairs]}
+        _, elapsed = timed(lambda: [client.post('/api/predict/batch', json=batch) for _ in range(repeats)])
+        results['batch_predictions_per_s'] = len(pairs) * repeats / elapsed
+
+    results['peak_rss_total_mb'] = peak_rss_mb()
+    return results
+
+def flatten(results, prefix=''):
+    """Nested metric dicts as {'5x.predict_latency.p99_ms': value}"""
+    flat = {}
+    for key, value in results.items():
+        name = f'{prefix}{key}'
+        if isinstance(value, dict):
+            flat.update(flatten(value, f'{name}.'))
+        elif isinstance(value, (int, float)):
+            flat[name] = value
+    return flat
+
+def compare(results, baseline, threshold):
+    """Print each metric against the baseline; return the regressed metric names"""
+    current = flatten(results['scales'])
+    previous = flatten(baseline.get('scales', {}))
+    regressions = []
+
+    print(f"\n📏 Comparison against baseline (threshold {threshold:.0%}):")
+    for name, value in current.items():
+        if name not in previous or previous[name] == 0 or name.endswith('.seasons') or name.endswith('.games'):
+            continue
+        ratio = value / previous[name]
+        if name.rsplit('.', 1)[-1] in HIGHER_IS_BETTER:
+            worse = ratio < 1 - threshold
+        else:
+            worse = ratio > 1 + threshold
+        marker = '❌' if worse else '  '
+        print(f"{marker} {name:<45} {previous[name]:>12.4f} -> {value:>12.4f} ({ratio:.2f}x)")
+        if worse:
+            regressions.append(name)
+
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark extractor load, feature extraction and prediction latency')
+    parser.add_argument('--scales', default=','.join(SCALES), help=f'comma separated subset of {list(SCALES)}')
+    parser.add_argument('--repeats', type=int, default=3, help='passes over all 870 matchups per measurement')
+    parser.add_argument('--output', default='benchmark_results.json')
+    parser.add_argument('--baseline', help='earlier results JSON to compare against')
+    parser.add_argument('--threshold', type=float, default=0.2, help='relative slowdown that counts as a regression')
+    parser.add_argument('--run-scale', type=int, help=argparse.SUPPRESS)
+    parser.add_argument('--workdir', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    # Child mode: one scale, one fresh interpreter, JSON on stdout
+    if args.run_scale is not None:
+        print(json.dumps(run_scale(args.run_scale, args.workdir, args.repeats)))
+        return
+
+    import numpy
+    import pandas
+    import sklearn
+    results = {
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'numpy': numpy.__version__,
+            'pandas': pandas.__version__,
+            'scikit-learn': sklearn.__version__
+        },
+        'repeats': args.repeats,
+        'scales': {}
+    }
+
+    for scale in args.scales.split(','):
+        seasons = SCALES[scale]
+        print(f"⏱️ Benchmarking {scale} ({seasons} seasons)...")
+        with tempfile.TemporaryDirectory(prefix=f'nba-bench-{scale}-') as workdir:
+            output = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), '--run-scale', str(seasons),
+                 '--workdir', workdir, '--repeats', str(args.repeats)],
+                check=True, capture_output=True, text=True
+            ).stdout
+        scale_results = json.loads(output.strip().splitlines()[-1])
+        results['scales'][scale] = scale_results
+
+        print(f"   cold start {scale_results['cold_start_s']:.2f}s (store {scale_results['store_start_s']:.2f}s), "
+              f"peak RSS {scale_results['peak_rss_mb']:.0f} MB, "
+              f"frame {scale_results['frame_mb']:.1f} MB (lean {scale_results['lean_frame_mb']:.3f} MB)")
+        print(f"   predict p50 {scale_results['predict_latency']['p50_ms']:.2f}ms "
+              f"p99 {scale_results['predict_latency']['p99_ms']:.2f}ms, "
+              f"batch {scale_results['batch_predictions_per_s']:.0f} predictions/s, "
+              f"training set {scale_results['training_set_build_s']:.2f}s")
+
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"💾 Results written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"❌ {len(regressions)} metrics regressed")
+            sys.exit(1)
+        print("✅ No regressions")
+
+if __name__ == "__main__":
+    main()
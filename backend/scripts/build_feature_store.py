@@ -0,0 +1,25 @@
+import sys
+import os
+
+# Add parent directory to path so we can import feature_extractor
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from feature_extractor import NBAFeatureExtractor
+from feature_store import file_checksum
+
+def build_feature_store():
+    """Materialize the processed games frame into the columnar feature store"""
+    
+    backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    games_path = os.path.join(backend_dir, 'data', 'nba_games.csv')
+    store_path = os.path.join(backend_dir, 'data', 'feature_store')
+    
+    print("🏗️ BUILDING FEATURE STORE...")
+    
+    # Always recompute from the CSV, then write the store
+    extractor = NBAFeatureExtractor(games_path)
+    extractor.save_store(store_path, file_checksum(games_path))
+    
+    print(f"✅ Feature store ready at {store_path}")
+
+if __name__ == "__main__":
+    build_feature_store()
@@ -0,0 +1,88 @@
+import argparse
+import sys
+import os
+import pandas as pd
+
+# Add parent directory to path so we can import feature_extractor
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BACKEND_DIR)
+from feature_extractor import NBAFeatureExtractor, PREDICTORS
+from feature_store import file_checksum
+from model_registry import ModelRegistry
+from service import MAX_BATCH_SIZE, MODEL_PATH, PICKLE_MODEL_PATH, PredictionService
+from snapshots import write_snapshot
+from team_stats import TeamStatsIndex
+
+def build_snapshot(schedule_path, as_of=None, days=14, output_dir=None):
+    """Predict every scheduled game in the next `days` days and write a snapshot
+
+    Meant to run nightly (e.g. from cron); the API serves the newest
+    snapshot from /api/upcoming without touching the model. The snapshot
+    holds only the games and what they were scored with (not the run
+    date), so a rerun that predicts the same games keeps its version.
+    """
+    output_dir = output_dir or os.path.join(BACKEND_DIR, 'data', 'snapshots')
+    games_path = os.path.join(BACKEND_DIR, 'data', 'nba_games.csv')
+    as_of = pd.Timestamp(as_of or pd.Timestamp.now().normalize())
+
+    print("🗓️ BUILDING UPCOMING GAMES SNAPSHOT...")
+
+    schedule = pd.read_csv(schedule_path, dtype=str)
+    dates = pd.to_datetime(schedule['date'])
+    upcoming = schedule[(dates >= as_of) & (dates < as_of + pd.Timedelta(days=days))]
+
+    # Order by actual tip-off: '10:00 PM' sorts before '7:30 PM' as text; games without a time go last
+    tipoff = pd.to_datetime(schedule['date'] + ' ' + schedule['time'].fillna(''), format='%Y-%m-%d %I:%M %p', errors='coerce')
+    upcoming = upcoming.assign(_date=dates, _tipoff=tipoff)
+    upcoming = upcoming.sort_values(['_date', '_tipoff'], kind='stable', na_position='last').drop(columns=['_date', '_tipoff'])
+    print(f"Found {len(upcoming)} games between {as_of.date()} and {(as_of + pd.Timedelta(days=days - 1)).date()}")
+
+    model_path = os.path.join(BACKEND_DIR, MODEL_PATH)
+    if not os.path.exists(model_path):
+        model_path = os.path.join(BACKEND_DIR, PICKLE_MODEL_PATH)
+    registry = ModelRegistry(model_path, PREDICTORS)
+    registry.load()
+    extractor = NBAFeatureExtractor(games_path, store_path=os.path.join(BACKEND_DIR, 'data', 'feature_store'))
+    team_stats = TeamStatsIndex(os.path.join(BACKEND_DIR, 'data', 'team_stats.csv'))
+    service = PredictionService(registry, extractor, team_stats, cache_size=0)
+
+    # Same batch path as /api/predict/batch: one predict_proba per chunk of games
+    matchups = [{'home_team': home, 'away_team': away} for home, away in zip(upcoming['home_team'], upcoming['away_team'])]
+    predictions = []
+    for start in range(0, len(matchups), MAX_BATCH_SIZE):
+        payload, status = service.predict_batch(matchups[start:start + MAX_BATCH_SIZE])
+        if status != 200:
+            raise RuntimeError(payload['error'])
+        predictions.extend(payload['predictions'])
+
+    games = []
+    for game, prediction in zip(upcoming.to_dict('records'), predictions):
+        time = game.get('time')
+        games.append({'date': game['date'], 'time': time if isinstance(time, str) else None, **prediction})
+
+    failed = sum('error' in game for game in games)
+    if failed:
+        print(f"⚠️ {failed} games could not be predicted")
+
+    snapshot = {
+        'model_version': registry.current.version,
+        'games_checksum': file_checksum(games_path),
+        'games': games
+    }
+    version, path = write_snapshot(snapshot, output_dir)
+    print(f"💾 Snapshot {version} with {len(games)} games written to {path}")
+    return version
+
+def main():
+    parser = argparse.ArgumentParser(description='Precompute predictions for upcoming scheduled games')
+    parser.add_argument('--schedule', default=os.path.join(BACKEND_DIR, 'data', 'schedule.csv'),
+                        help='CSV with date, time, home_team and away_team columns')
+    parser.add_argument('--as-of', help='first day to include (YYYY-MM-DD, default today)')
+    parser.add_argument('--days', type=int, default=14, help='how many days of games to include')
+    parser.add_argument('--output-dir', help='snapshot directory (default data/snapshots)')
+    args = parser.parse_args()
+
+    build_snapshot(args.schedule, args.as_of, args.days, args.output_dir)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+import sys
+import os
+import numpy as np
+import joblib
+
+# Add parent directory to path so we can import numpy_scorer
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BACKEND_DIR)
+from numpy_scorer import check_parity, export_scorer, load_scorer
+
+def export_existing_model(samples=100000, seed=0):
+    """Export models/simple_clean_model.pkl as the NumPy scorer artifact
+
+    train_model.py already does this for freshly trained bundles; this covers
+    a bundle trained elsewhere. Parity is checked on random inputs spread
+    over (and a little beyond) the range the scaler was fitted on.
+    """
+    models_dir = os.path.join(BACKEND_DIR, 'models')
+    bundle = joblib.load(os.path.join(models_dir, 'simple_clean_model.pkl'))
+    model, scaler = bundle['model'], bundle['scaler']
+
+    print("📦 EXPORTING NUMPY SCORER...")
+
+    rng = np.random.default_rng(seed)
+    low, high = scaler.data_min_, scaler.data_max_
+    margin = (high - low) * 0.25
+    X = rng.uniform(low - margin, high + margin, (samples, len(low)))
+    X = np.vstack([X, np.zeros((1, len(low))), low, high])
+
+    scorer_path = os.path.join(models_dir, 'simple_clean_model.json')
+    export_scorer(model, scaler, bundle['predictors'], scorer_path + '.new')
+    checked = check_parity(model, scaler, load_scorer(scorer_path + '.new'), X)
+    os.replace(scorer_path + '.new', scorer_path)
+    print(f"💾 NumPy scorer exported to {scorer_path} (identical on {checked} samples)")
+
+if __name__ == "__main__":
+    export_existing_model()
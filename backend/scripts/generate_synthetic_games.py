@@ -0,0 +1,122 @@
+import argparse
+import numpy as np
+import pandas as pd
+
+TEAMS = [
+    'CLE', 'MEM', 'DEN', 'OKC', 'ATL', 'CHI', 'IND', 'BOS', 'NYK', 'SAC',
+    'MIL', 'DET', 'HOU', 'MIN', 'DAL', 'SAS', 'GSW', 'PHO', 'LAL', 'LAC',
+    'UTA', 'POR', 'TOR', 'MIA', 'NOP', 'PHI', 'WAS', 'ORL', 'BRK', 'CHO'
+]
+
+# Box score columns in nba_games.csv order, with a rough (mean, std) per stat
+TEAM_STATS = {
+    'mp': (240.0, 5.0), 'fg': (42.0, 4.5), 'fga': (88.0, 5.5), 'fg%': (0.47, 0.05),
+    '3p': (13.0, 3.5), '3pa': (36.0, 5.0), '3p%': (0.36, 0.06), 'ft': (17.5, 5.0),
+    'fta': (22.5, 5.5), 'ft%': (0.78, 0.08), 'orb': (10.0, 3.5), 'drb': (34.0, 4.5),
+    'trb': (44.0, 6.0), 'ast': (25.5, 5.0), 'stl': (7.5, 2.8), 'blk': (5.0, 2.3),
+    'tov': (13.5, 3.5), 'pf': (19.5, 4.0), 'pts': (113.0, 12.0), 'ts%': (0.58, 0.05),
+    'efg%': (0.54, 0.05), '3par': (0.40, 0.07), 'ftr': (0.26, 0.08), 'orb%': (23.0, 6.0),
+    'drb%': (77.0, 6.0), 'trb%': (50.0, 5.0), 'ast%': (61.0, 8.0), 'stl%': (7.5, 2.7),
+    'blk%': (8.5, 3.8), 'tov%': (12.5, 3.0), 'usg%': (100.0, 0.0), 'ortg': (114.0, 11.0),
+    'drtg': (114.0, 11.0), '+/-': (0.0, 14.0)
+}
+
+# Best single player in each stat, plus game score (player-level only)
+MAX_STATS = {
+    'mp': (40.0, 3.5), 'fg': (11.0, 2.8), 'fga': (21.0, 4.0), 'fg%': (0.80, 0.15),
+    '3p': (4.5, 1.6), '3pa': (10.0, 2.7), '3p%': (0.75, 0.2), 'ft': (7.5, 3.0),
+    'fta': (9.0, 3.2), 'ft%': (1.0, 0.05), 'orb': (4.0, 1.6), 'drb': (10.0, 2.6),
+    'trb': (12.5, 3.0), 'ast': (9.0, 2.6), 'stl': (2.8, 1.1), 'blk': (2.5, 1.3),
+    'tov': (4.5, 1.4), 'pf': (4.5, 1.0), 'pts': (31.0, 6.5), 'ts%': (0.95, 0.25),
+    'efg%': (0.95, 0.25), '3par': (0.90, 0.2), 'ftr': (1.2, 0.8), 'orb%': (25.0, 12.0),
+    'drb%': (40.0, 12.0), 'trb%': (27.0, 8.0), 'ast%': (45.0, 10.0), 'stl%': (6.0, 3.0),
+    'blk%': (10.0, 6.0), 'tov%': (40.0, 20.0), 'usg%': (36.0, 6.0), 'ortg': (200.0, 50.0),
+    'drtg': (122.0, 8.0), '+/-': (14.0, 7.0), 'gmsc': (25.0, 6.0)
+}
+
+def generate_games(seasons=1, first_season=2019, seed=0):
+    """Synthetic games in the nba_games.csv layout (two rows per game)
+
+    Each team gets a fixed strength that nudges its points and +/- so the
+    data has some signal to fit; every other stat is independent noise.
+    """
+    rng = np.random.default_rng(seed)
+    strength = dict(zip(TEAMS, rng.normal(0, 4.0, len(TEAMS))))
+
+    # Each game day every team plays once, 82 days per season
+    matchups = []
+    for season in range(first_season, first_season + seasons):
+        start = pd.Timestamp(f'{season - 1}-10-22')
+        for day in range(82):
+            order = rng.permutation(len(TEAMS))
+            date = start + pd.Timedelta(days=2 * day)
+            for k in range(0, len(TEAMS), 2):
+                matchups.append((TEAMS[order[k]], TEAMS[order[k + 1]], date, season))
+
+    n_games = len(matchups)
+    team_cols = list(TEAM_STATS)
+    max_cols = [f'{stat}_max' for stat in MAX_STATS]
+
+    def box_scores():
+        team_means, team_stds = np.array(list(TEAM_STATS.values())).T
+        max_means, max_stds = np.array(list(MAX_STATS.values())).T
+        team_block = rng.normal(team_means, team_stds, (n_games, len(team_cols)))
+        max_block = rng.normal(max_means, max_stds, (n_games, len(max_cols)))
+        return np.round(team_block, 3), np.round(max_block, 3)
+
+    home_team_block, home_max_block = box_scores()
+    away_team_block, away_max_block = box_scores()
+
+    # Stronger teams (and home teams) score more
+    home_edge = np.array([strength[h] - strength[a] + 2.0 for h, a, _, _ in matchups])
+    pts = team_cols.index('pts')
+    home_team_block[:, pts] = np.round(home_team_block[:, pts] + home_edge / 2)
+    away_team_block[:, pts] = np.round(away_team_block[:, pts] - home_edge / 2)
+    tied = home_team_block[:, pts] == away_team_block[:, pts]
+    home_team_block[tied, pts] += 1  # no ties in basketball
+    margin = home_team_block[:, pts] - away_team_block[:, pts]
+    home_team_block[:, team_cols.index('+/-')] = margin
+    away_team_block[:, team_cols.index('+/-')] = -margin
+    home_won = margin > 0
+
+    frames = []
+    for is_home in (True, False):
+        own_team, own_max = (home_team_block, home_max_block) if is_home else (away_team_block, away_max_block)
+        opp_team, opp_max = (away_team_block, away_max_block) if is_home else (home_team_block, home_max_block)
+        teams = [m[0] if is_home else m[1] for m in matchups]
+        opponents = [m[1] if is_home else m[0] for m in matchups]
+
+        frame = pd.concat([
+            pd.DataFrame(own_team, columns=team_cols),
+            pd.DataFrame(own_max, columns=max_cols),
+            pd.DataFrame({'team': teams, 'total': own_team[:, pts]}),
+            pd.DataFrame(opp_team, columns=[f'{col}_opp' for col in team_cols]),
+            pd.DataFrame(opp_max, columns=[f'{col}_opp' for col in max_cols]),
+            pd.DataFrame({
+                'team_opp': opponents,
+                'total_opp': opp_team[:, pts],
+                'home': int(is_home),
+                'season': [m[3] for m in matchups],
+                'date': [m[2].strftime('%Y-%m-%d') for m in matchups],
+                'won': home_won if is_home else ~home_won
+            })
+        ], axis=1)
+        frames.append(frame)
+
+    # Interleave so each game's two rows sit together, in date order like the real file
+    games = pd.concat(frames, keys=[0, 1]).swaplevel().sort_index().reset_index(drop=True)
+    return games
+
+def main():
+    parser = argparse.ArgumentParser(description='Write a synthetic nba_games.csv')
+    parser.add_argument('--seasons', type=int, default=1, help='number of 82-game seasons to generate')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default='data/nba_games_synthetic.csv')
+    args = parser.parse_args()
+
+    games = generate_games(args.seasons, seed=args.seed)
+    games.to_csv(args.output)
+    print(f"✅ Wrote {len(games)} rows ({args.seasons} seasons) to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -8,10 +8,11 @@ import os
 
 # Add parent directory to path so we can import feature_extractor
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from feature_extractor import NBAFeatureExtractor
+from feature_extractor import NBAFeatureExtractor, PREDICTORS
+from numpy_scorer import check_parity, export_scorer, load_scorer
 import joblib
 
-def create_simple_model():
+def create_simple_model(min_season=None):
     """Create a simple model using the feature extractor's 22 features"""
     
     print("🎯 CREATING SIMPLE MODEL WITH 22 CLEAN FEATURES...")
@@ -23,39 +24,17 @@ def create_simple_model():
     teams = extractor.df['team'].unique()
     print(f"Found {len(teams)} teams: {teams}")
     
-    # Create training data by extracting features for historical matchups
+    # Build point-in-time features for every historical game in one pass
     print("📊 Creating training dataset...")
     
-    X_data = []
-    y_data = []
-    
-    # Sample recent games to create training pairs
-    recent_games = extractor.df[extractor.df['season'] >= 2023].copy()
-    
-    for idx, row in recent_games.iterrows():
-        if idx % 500 == 0:
-            print(f"Processing game {idx}/{len(recent_games)}")
-            
-        home_team = row['team']
-        away_team = row['team_opp']
-        
-        # Extract features for this matchup
-        features = extractor.get_prediction_features(home_team, away_team)
-        
-        if features is not None and len(features) == 22:
-            X_data.append(features)
-            y_data.append(int(row['won']))  # 1 if home team won, 0 if lost
-    
-    print(f"✅ Created {len(X_data)} training samples")
-    
-    if len(X_data) == 0:
+    X, y, _ = extractor.build_training_set(min_season=min_season)
+    
+    print(f"✅ Created {len(X)} training samples")
+    
+    if len(X) == 0:
         print("❌ No training data created!")
         return None
     
-    # Convert to arrays
-    X = np.array(X_data)
-    y = np.array(y_data)
-    
     print(f"Training data shape: {X.shape}")
     print(f"Target distribution: {np.bincount(y)}")
     
@@ -72,15 +51,6 @@ def create_simple_model():
     accuracy = accuracy_score(y, predictions)
     print(f"📈 Training accuracy: {accuracy:.1%}")
     
-    # Feature names that match what the extractor provides
-    feature_names = [
-        'fga', 'fg_opp', 'orb_opp', 'stl%_opp', 'pf_max_opp', 'orb%_max_opp',
-        'efg%_10_x', 'fg_max_10_x', '+/-_max_10_x', 'trb%_max_10_x', 'blk_opp_10_x',
-        'drb%_opp_10_x', 'ft%_max_opp_10_x', '+/-_max_opp_10_x', 'efg%_max_opp_10_x',
-        'home_next', 'mp_10_y', 'gmsc_max_10_y', 'blk%_opp_10_y',
-        'ft%_max_opp_10_y', 'ast_max_opp_10_y', '+/-_max_opp_10_y'
-    ]
-    
     # Save model bundle (note the path change - now we're in scripts/ so go up one level)
     models_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'models')
     os.makedirs(models_dir, exist_ok=True)
@@ -88,13 +58,22 @@ def create_simple_model():
     model_bundle = {
         'model': model,
         'scaler': scaler,
-        'predictors': feature_names
+        'predictors': list(PREDICTORS)
     }
     
+    # Write then rename so a running API never loads a half-written bundle
     model_path = os.path.join(models_dir, 'simple_clean_model.pkl')
-    joblib.dump(model_bundle, model_path)
+    joblib.dump(model_bundle, model_path + '.tmp')
+    os.replace(model_path + '.tmp', model_path)
     print(f"💾 Simple model saved to {model_path}")
     
+    # The API serves the NumPy export; make sure it scores exactly like the bundle
+    scorer_path = os.path.join(models_dir, 'simple_clean_model.json')
+    export_scorer(model, scaler, PREDICTORS, scorer_path + '.new')
+    checked = check_parity(model, scaler, load_scorer(scorer_path + '.new'), X)
+    os.replace(scorer_path + '.new', scorer_path)
+    print(f"💾 NumPy scorer exported to {scorer_path} (identical on {checked} samples)")
+    
     # Test a few predictions
     print("\n🧪 Testing predictions...")
     test_teams = [('CLE', 'UTA'), ('GSW', 'LAL'), ('BOS', 'MIA')]
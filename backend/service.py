@@ -0,0 +1,630 @@
+import logging
+import os
+import numpy as np
+from feature_extractor import HOME_SLOT, NBAFeatureExtractor, OPPONENT_MASK, PREDICTORS
+from metrics import metrics, span
+from model_registry import ModelRegistry
+from prediction_cache import PredictionCache
+from simulator import SeasonSimulator
+from snapshots import SnapshotStore
+from team_stats import TeamStatsIndex
+
+logger = logging.getLogger('nba_api')
+
+fallback_count = metrics.counter('nba_prediction_fallbacks_total', 'Predictions answered by the team-stats fallback')
+error_count = metrics.counter('nba_prediction_errors_total', 'Model prediction failures by team', ['team'])
+
+# The exported NumPy scorer is preferred; the pickled scikit-learn bundle is the fallback
+MODEL_PATH = 'models/simple_clean_model.json'
+PICKLE_MODEL_PATH = 'models/simple_clean_model.pkl'
+
+# Largest slate a single batch request may score (a full 30x29 matchup grid fits)
+MAX_BATCH_SIZE = 1000
+
+# Which feature slots an explanation takes from the away team
+OPPONENT_SLOTS = OPPONENT_MASK.tolist()
+
+# Bounds for /api/simulate: a full 82-game season and 100k simulated seasons
+MAX_SCHEDULE_GAMES = 1230
+MAX_SIMULATIONS = 100000
+
+class PredictionService:
+    """Everything behind the prediction API, independent of the web framework
+
+    Holds the model registry, feature extractor, team stats and response
+    caches. Methods return (payload, status) pairs that the Flask routes (or
+    any other front end) serialize as they see fit.
+    """
+
+    def __init__(self, registry, extractor, team_stats, cache_size=4096, snapshots=None):
+        self.registry = registry
+        self.extractor = extractor
+        self.team_stats = team_stats
+
+        # Precomputed upcoming-game predictions written by scripts/build_snapshot.py
+        self.snapshots = snapshots
+
+        # Head-to-head grid payloads keyed on (model version, data version)
+        self.matchup_matrix_cache = {}
+
+        # Full /api/predict responses keyed on (home, away, model version, data version)
+        self.prediction_cache = PredictionCache(maxsize=cache_size)
+
+        # (model version, data version, teams, home win probability grid)
+        self.home_win_grid_entry = None
+
+        # (model version, data version, team positions, scaled rows, feature entries, totals)
+        self.contribution_entry = None
+
+        # /api/simulate responses keyed on the versions, schedule, wins and run settings
+        self.simulation_cache = PredictionCache(maxsize=32)
+        self.simulator = SeasonSimulator(int(os.environ.get('SIMULATION_PROCESSES', 0)) or None)
+
+        registry.on_swap(self.clear_model_caches)
+
+        metrics.gauge('nba_prediction_cache_hits_total', 'Prediction cache hits',
+                      lambda: self.prediction_cache.hits, 'counter')
+        metrics.gauge('nba_prediction_cache_misses_total', 'Prediction cache misses',
+                      lambda: self.prediction_cache.misses, 'counter')
+        metrics.gauge('nba_prediction_cache_size', 'Responses held in the prediction cache',
+                      lambda: len(self.prediction_cache.entries))
+        metrics.gauge('nba_data_version', 'Extractor data version', lambda: self.extractor.data_version)
+
+    @classmethod
+    def from_environment(cls):
+        """Build the service from the files under the working directory and env settings"""
+        # Load model and feature extractor
+        print("🚀 Loading simple model and feature extractor...")
+        registry = ModelRegistry(MODEL_PATH if os.path.exists(MODEL_PATH) else PICKLE_MODEL_PATH, PREDICTORS)
+        try:
+            registry.load()
+            print(f"✅ Simple model loaded with {len(registry.current.predictors)} features")
+        except Exception:
+            print("❌ Simple model not found, please run scripts/train_model.py first")
+
+        # Pick up retrained bundles automatically (seconds between checks, 0 disables)
+        watch_interval = float(os.environ.get('MODEL_WATCH_INTERVAL', 10))
+        if watch_interval > 0:
+            registry.watch(watch_interval)
+
+        # LEAN_EXTRACTOR=1 keeps only each team's latest row in float32 (no game history);
+        # STREAMING_EXTRACTOR=1 also builds it by reading a stale CSV in chunks
+        extractor = NBAFeatureExtractor(store_path='data/feature_store',
+                                        lean=os.environ.get('LEAN_EXTRACTOR') == '1',
+                                        streaming=os.environ.get('STREAMING_EXTRACTOR') == '1')
+        team_stats = TeamStatsIndex('data/team_stats.csv')
+
+        return cls(registry, extractor, team_stats,
+                   cache_size=int(os.environ.get('PREDICTION_CACHE_SIZE', 4096)),
+                   snapshots=SnapshotStore('data/snapshots'))
+
+    def clear_model_caches(self, bundle=None):
+        """Drop cached responses computed by the previous model bundle"""
+        self.prediction_cache.clear()
+        self.matchup_matrix_cache.clear()
+        self.simulation_cache.clear()
+        self.home_win_grid_entry = None
+        self.contribution_entry = None
+
+    def team_label(self, team):
+        """Metric label for a team, collapsing unknown codes so labels stay bounded"""
+        return team if team in self.team_stats.records else 'unknown'
+
+    def build_prediction(self, home_team, away_team, home_win_prob, with_score=True):
+        """Turn a home win probability into the prediction response payload
+
+        with_score=False leaves out predicted_score, which comes from the
+        current team stats.
+        """
+        away_win_prob = 1 - home_win_prob
+
+        winner = home_team if home_win_prob > 0.5 else away_team
+
+        prediction = {
+            'winner': winner,
+            'home_team': home_team,
+            'away_team': away_team,
+            'home_win_probability': float(home_win_prob),
+            'away_win_probability': float(away_win_prob)
+        }
+        if not with_score:
+            return prediction
+
+        # Score prediction based on team stats
+        with span('team_stats_lookup'):
+            home_team_stats = self.team_stats.get(home_team)
+            away_team_stats = self.team_stats.get(away_team)
+
+        base_home = home_team_stats['PTS']
+        base_away = away_team_stats['PTS']
+
+        # Realistic score adjustments
+        home_score = int(base_home + (home_win_prob - 0.5) * 20)
+        away_score = int(base_away + (away_win_prob - 0.5) * 20)
+
+        prediction['predicted_score'] = {
+            'home': home_score,
+            'away': away_score
+        }
+        return prediction
+
+    def fallback_prediction(self, home_team, away_team):
+        """Enhanced fallback using team stats when model features are unavailable"""
+        with span('team_stats_lookup'):
+            home_team_stats = self.team_stats.get(home_team)
+            away_team_stats = self.team_stats.get(away_team)
+
+        home_win_rate = home_team_stats['W'] / home_team_stats['GP']
+        away_win_rate = away_team_stats['W'] / away_team_stats['GP']
+
+        # Factor in team strength and home advantage
+        strength_diff = (home_win_rate - away_win_rate) * 0.4
+        home_advantage = 0.06
+
+        home_win_prob = 0.5 + strength_diff + home_advantage
+        home_win_prob = max(0.25, min(0.75, home_win_prob))
+        away_win_prob = 1 - home_win_prob
+
+        winner = home_team if home_win_prob > 0.5 else away_team
+
+        return {
+            'winner': winner,
+            'home_team': home_team,
+            'away_team': away_team,
+            'home_win_probability': float(home_win_prob),
+            'away_win_probability': float(away_win_prob),
+            'predicted_score': {
+                'home': int(home_team_stats['PTS']),
+                'away': int(away_team_stats['PTS'])
+            }
+        }
+
+    def predict(self, home_team, away_team, as_of=None):
+        """Single matchup prediction, falling back to team stats when the model can't answer
+
+        With as_of (YYYY-MM-DD) the matchup is scored from each team's games
+        before that date instead; see predict_as_of.
+        """
+        if as_of is not None:
+            return self.predict_as_of(home_team, away_team, as_of)
+
+        # One bundle snapshot for the whole request, even if a reload lands meanwhile
+        bundle = self.registry.current
+        if bundle is None:
+            return {'error': 'Model not loaded'}, 500
+
+        cache_key = (home_team, away_team, bundle.version, self.extractor.data_version)
+        cached = self.prediction_cache.get(cache_key)
+        if cached is not None:
+            return cached, 200
+
+        try:
+            logger.debug("Prediction: %s (home) vs %s (away)", home_team, away_team)
+
+            # Extract real features using actual game data
+            with span('feature_extraction'):
+                features = self.extractor.get_prediction_features(home_team, away_team)
+
+            if features is None:
+                raise Exception("Could not extract features for these teams")
+
+            # Scale and predict
+            with span('scaling'):
+                features_scaled = bundle.scaler.transform([features])
+            with span('inference'):
+                home_win_prob = bundle.model.predict_proba(features_scaled)[0][1]
+
+            prediction = self.build_prediction(home_team, away_team, home_win_prob)
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Result: %s %.1f%% vs %s %.1f%%, feature range %.2f to %.2f",
+                             home_team, home_win_prob * 100, away_team, (1 - home_win_prob) * 100,
+                             min(features), max(features))
+
+            self.prediction_cache.put(cache_key, prediction)
+            return prediction, 200
+
+        except Exception as e:
+            return self.fallback_response(home_team, away_team, e)
+
+    def fallback_response(self, home_team, away_team, error):
+        """Record a failed model prediction and answer from team stats instead"""
+        logger.warning("Model prediction failed for %s vs %s: %s", home_team, away_team, error)
+        error_count.inc(team=self.team_label(home_team))
+        error_count.inc(team=self.team_label(away_team))
+
+        try:
+            prediction = self.fallback_prediction(home_team, away_team)
+            fallback_count.inc()
+            return prediction, 200
+        except Exception:
+            return {'error': str(error)}, 500
+
+    def predict_as_of(self, home_team, away_team, as_of):
+        """What the model would have said before the games of `as_of`
+
+        There is no team-stats fallback here: current season stats say
+        nothing about a past date, so missing history is an error. For the
+        same reason the response has no predicted_score.
+        """
+        bundle = self.registry.current
+        if bundle is None:
+            return {'error': 'Model not loaded'}, 500
+
+        try:
+            day = str(np.datetime64(as_of, 'D')) if isinstance(as_of, str) else None
+        except ValueError:
+            day = None
+        if day is None:
+            return {'error': 'date must be formatted YYYY-MM-DD'}, 400
+
+        cache_key = (home_team, away_team, bundle.version, self.extractor.data_version, day)
+        cached = self.prediction_cache.get(cache_key)
+        if cached is not None:
+            return cached, 200
+
+        try:
+            with span('feature_extraction'):
+                features = self.extractor.get_prediction_features(home_team, away_team, as_of=day)
+        except ValueError as e:
+            return {'error': str(e)}, 400
+
+        if features is None:
+            return {'error': f'No games before {day} for {home_team} or {away_team}'}, 404
+
+        with span('scaling'):
+            features_scaled = bundle.scaler.transform([features])
+        with span('inference'):
+            home_win_prob = bundle.model.predict_proba(features_scaled)[0][1]
+
+        prediction = self.build_prediction(home_team, away_team, home_win_prob, with_score=False)
+        prediction['as_of'] = day
+
+        self.prediction_cache.put(cache_key, prediction)
+        return prediction, 200
+
+    def cached_prediction(self, home_team, away_team):
+        """The cached /api/predict response for a matchup, or None
+
+        Misses are left uncounted: callers go on to predict_many, which counts them.
+        """
+        bundle = self.registry.current
+        if bundle is None:
+            return None
+        return self.prediction_cache.get((home_team, away_team, bundle.version, self.extractor.data_version),
+                                         count_miss=False)
+
+    def cached_explanation(self, home_team, away_team):
+        """The cached /api/predict/explain response for a matchup, or None
+
+        Misses are left uncounted: callers go on to explain, which counts them.
+        """
+        bundle = self.registry.current
+        if bundle is None:
+            return None
+        return self.prediction_cache.get((home_team, away_team, bundle.version, self.extractor.data_version, 'explain'),
+                                         count_miss=False)
+
+    def predict_many(self, pairs):
+        """Answer several single-matchup requests with one predict_proba call
+
+        Returns one (payload, status) per pair, exactly what predict() would
+        have returned for it; pairs the model can't score get predict()'s
+        fallback handling (see fallback_response).
+        """
+        bundle = self.registry.current
+        if bundle is None:
+            return [({'error': 'Model not loaded'}, 500)] * len(pairs)
+
+        data_version = self.extractor.data_version
+        results = [None] * len(pairs)
+        missing = []
+        for i, (home_team, away_team) in enumerate(pairs):
+            cached = self.prediction_cache.get((home_team, away_team, bundle.version, data_version))
+            if cached is not None:
+                results[i] = (cached, 200)
+            else:
+                missing.append(i)
+
+        with span('feature_extraction'):
+            features, scored = self.extractor.get_prediction_matrix([pairs[i] for i in missing])
+        probabilities = []
+        if len(scored) > 0:
+            with span('scaling'):
+                features_scaled = bundle.scaler.transform(features)
+            with span('inference'):
+                probabilities = bundle.model.predict_proba(features_scaled)[:, 1]
+
+        home_win_probs = dict(zip(scored, probabilities))
+        for j, i in enumerate(missing):
+            home_team, away_team = pairs[i]
+            try:
+                if j not in home_win_probs:
+                    raise Exception("Could not extract features for these teams")
+                prediction = self.build_prediction(home_team, away_team, home_win_probs[j])
+                self.prediction_cache.put((home_team, away_team, bundle.version, data_version), prediction)
+                results[i] = (prediction, 200)
+            except Exception as e:
+                # Already counted as a cache miss above, so skip predict() and its lookup
+                results[i] = self.fallback_response(home_team, away_team, e)
+
+        logger.debug("Scored %d of %d coalesced matchups with the model", len(scored), len(pairs))
+        return results
+
+    def predict_batch(self, matchups):
+        """Score a list of {home_team, away_team} items with one predict_proba call"""
+        bundle = self.registry.current
+        if bundle is None:
+            return {'error': 'Model not loaded'}, 500
+
+        if not isinstance(matchups, list):
+            return {'error': 'Expected a JSON body with a "matchups" list'}, 400
+
+        if len(matchups) > MAX_BATCH_SIZE:
+            return {'error': f'Batch size is limited to {MAX_BATCH_SIZE} matchups'}, 400
+
+        logger.debug("Batch prediction: %d matchups", len(matchups))
+
+        # Validate each item up front so one bad entry can't fail the batch
+        results = [None] * len(matchups)
+        pairs = []
+        positions = []
+        for i, item in enumerate(matchups):
+            if not isinstance(item, dict) or not isinstance(item.get('home_team'), str) or not isinstance(item.get('away_team'), str):
+                results[i] = {'error': 'Each matchup needs home_team and away_team'}
+                continue
+            pairs.append((item['home_team'], item['away_team']))
+            positions.append(i)
+
+        # One feature matrix, one transform and one predict_proba for the whole batch
+        with span('feature_extraction'):
+            features, scored = self.extractor.get_prediction_matrix(pairs)
+        probabilities = []
+        if len(scored) > 0:
+            with span('scaling'):
+                features_scaled = bundle.scaler.transform(features)
+            with span('inference'):
+                probabilities = bundle.model.predict_proba(features_scaled)[:, 1]
+
+        home_win_probs = dict(zip(scored, probabilities))
+        for j, (home_team, away_team) in enumerate(pairs):
+            i = positions[j]
+            try:
+                if j in home_win_probs:
+                    results[i] = self.build_prediction(home_team, away_team, home_win_probs[j])
+                else:
+                    results[i] = self.fallback_prediction(home_team, away_team)
+                    fallback_count.inc()
+            except Exception:
+                error_count.inc(team=self.team_label(home_team))
+                error_count.inc(team=self.team_label(away_team))
+                results[i] = {
+                    'home_team': home_team,
+                    'away_team': away_team,
+                    'error': f'Could not predict {home_team} vs {away_team}'
+                }
+
+        logger.debug("Scored %d of %d matchups with the model", len(scored), len(matchups))
+
+        return {'predictions': results}, 200
+
+    def matchup_matrix(self):
+        """Home win probability for every pairing of indexed teams, cached per version"""
+        bundle = self.registry.current
+        if bundle is None:
+            return {'error': 'Model not loaded'}, 500
+
+        cache_key = (bundle.version, self.extractor.data_version)
+        payload = self.matchup_matrix_cache.get(cache_key)
+
+        if payload is None:
+            teams, grid = self.home_win_grid(bundle)
+
+            payload = {
+                'teams': teams,
+                'model_version': bundle.version,
+                'data_version': self.extractor.data_version,
+                # home_win_probability[i][j]: teams[i] at home against teams[j]
+                'home_win_probability': [
+                    [None if i == j else float(grid[i, j]) for j in range(len(teams))]
+                    for i in range(len(teams))
+                ]
+            }
+
+            # Only the current versions are ever requested again
+            self.matchup_matrix_cache.clear()
+            self.matchup_matrix_cache[cache_key] = payload
+            logger.info("Built %dx%d matchup matrix", len(teams), len(teams))
+
+        return payload, 200
+
+    def home_win_grid(self, bundle):
+        """Home win probability for every pairing of indexed teams, computed once per version"""
+        data_version = self.extractor.data_version
+        entry = self.home_win_grid_entry
+        if entry is not None and entry[:2] == (bundle.version, data_version):
+            return entry[2], entry[3]
+
+        # Every pairing in one feature matrix, scored with a single predict_proba call
+        features, teams = self.extractor.get_matchup_matrix()
+        probabilities = bundle.model.predict_proba(bundle.scaler.transform(features))[:, 1]
+        grid = probabilities.reshape(len(teams), len(teams))
+
+        self.home_win_grid_entry = (bundle.version, data_version, teams, grid)
+        return teams, grid
+
+    def contribution_table(self, bundle):
+        """Every team's halves of a prediction explanation, computed once per version
+
+        A matchup's features take the team slots from the home team's row and
+        the opponent slots from the away team's row, and scaling and the
+        coefficients act slot by slot. So each team's row, scaled and
+        multiplied by the coefficients, holds both halves of any explanation
+        it appears in: the team slots when it plays at home, the opponent
+        slots when it plays away. Returns (team positions, scaled rows,
+        per-team feature entries, per-team [home half, away half] totals).
+        """
+        data_version = self.extractor.data_version
+        entry = self.contribution_entry
+        if entry is not None and entry[:2] == (bundle.version, data_version):
+            return entry[2:]
+
+        index = self.extractor.team_index
+        positions = {team: i for i, team in enumerate(index)}
+        raw = np.array(list(index.values()), dtype=np.float64).reshape(len(index), len(PREDICTORS))
+        raw[:, HOME_SLOT] = 1
+        scaled = bundle.scaler.transform(raw)
+        coefficients = bundle.model.coef_[0]
+        contributions = scaled * coefficients
+
+        totals = np.column_stack([contributions[:, ~OPPONENT_MASK].sum(axis=1),
+                                  contributions[:, OPPONENT_MASK].sum(axis=1)]).tolist()
+        entries = [
+            [
+                {'feature': name, 'team': team, 'value': value, 'scaled_value': scaled_value,
+                 'coefficient': coefficient, 'contribution': contribution}
+                for name, value, scaled_value, coefficient, contribution in zip(
+                    PREDICTORS, raw[i].tolist(), scaled[i].tolist(), coefficients.tolist(), contributions[i].tolist())
+            ]
+            for team, i in positions.items()
+        ]
+
+        self.contribution_entry = (bundle.version, data_version, positions, scaled, entries, totals)
+        return positions, scaled, entries, totals
+
+    def explain(self, home_team, away_team):
+        """A prediction plus each feature's log-odds contribution (scaled value times coefficient)
+
+        Only model predictions can be explained, so teams without game
+        history get a 404 instead of the team-stats fallback. The prediction
+        itself is the one /api/predict returns, and is cached for it.
+        """
+        bundle = self.registry.current
+        if bundle is None:
+            return {'error': 'Model not loaded'}, 500
+
+        data_version = self.extractor.data_version
+        cache_key = (home_team, away_team, bundle.version, data_version, 'explain')
+        cached = self.prediction_cache.get(cache_key)
+        if cached is not None:
+            return cached, 200
+
+        with span('feature_extraction'):
+            positions, scaled, entries, totals = self.contribution_table(bundle)
+        missing = [team for team in (home_team, away_team) if team not in positions]
+        if missing:
+            return {'error': f'No game history for {", ".join(missing)}; only model predictions can be explained'}, 404
+        home, away = positions[home_team], positions[away_team]
+
+        # Reuse a cached prediction; this request's lookup was already counted above
+        prediction_key = (home_team, away_team, bundle.version, data_version)
+        prediction = self.prediction_cache.get(prediction_key, count_hit=False, count_miss=False)
+        if prediction is None:
+            # The same scaled row predict() would build, taken from the table
+            with span('inference'):
+                home_win_prob = bundle.model.predict_proba([np.where(OPPONENT_MASK, scaled[away], scaled[home])])[0][1]
+            try:
+                prediction = self.build_prediction(home_team, away_team, home_win_prob)
+            except KeyError as e:
+                return {'error': str(e)}, 404
+            self.prediction_cache.put(prediction_key, prediction)
+
+        intercept = float(bundle.model.intercept_[0])
+        home_entries, away_entries = entries[home], entries[away]
+        explanation = dict(prediction)
+        explanation['explanation'] = {
+            'intercept': intercept,
+            'log_odds': intercept + totals[home][0] + totals[away][1],
+            'home_total': totals[home][0],
+            'away_total': totals[away][1],
+            'features': [
+                away_entries[i] if from_opponent else home_entries[i]
+                for i, from_opponent in enumerate(OPPONENT_SLOTS)
+            ]
+        }
+
+        self.prediction_cache.put(cache_key, explanation)
+        return explanation, 200
+
+    def simulate(self, games, simulations=10000, seed=0, wins=None):
+        """Project win totals and seeding odds by simulating the remaining schedule"""
+        bundle = self.registry.current
+        if bundle is None:
+            return {'error': 'Model not loaded'}, 500
+
+        if not isinstance(games, list) or len(games) > MAX_SCHEDULE_GAMES:
+            return {'error': f'Expected a "games" list of at most {MAX_SCHEDULE_GAMES} games'}, 400
+        if not isinstance(simulations, int) or not 1 <= simulations <= MAX_SIMULATIONS:
+            return {'error': f'simulations must be between 1 and {MAX_SIMULATIONS}'}, 400
+        if not isinstance(seed, int) or seed < 0:
+            return {'error': 'seed must be a non-negative integer'}, 400
+        if wins is not None and (not isinstance(wins, dict) or
+                                 not all(isinstance(value, int) and value >= 0 for value in wins.values())):
+            return {'error': 'wins must map team codes to non-negative integers'}, 400
+
+        teams, grid = self.home_win_grid(bundle)
+        indexed = set(teams)
+
+        schedule = []
+        for game in games:
+            if not isinstance(game, dict) or game.get('home_team') not in indexed or game.get('away_team') not in indexed:
+                return {'error': f'Unknown or missing teams in scheduled game {game}'}, 400
+            if game['home_team'] == game['away_team']:
+                return {'error': f'A team cannot play itself: {game}'}, 400
+            schedule.append((game['home_team'], game['away_team']))
+
+        # Wins banked so far default to the current standings
+        if wins is None:
+            wins = {team: int(record['W']) for team, record in self.team_stats.records.items()}
+
+        cache_key = (bundle.version, self.extractor.data_version, tuple(schedule),
+                     tuple(sorted(wins.items())), simulations, seed)
+        payload = self.simulation_cache.get(cache_key)
+        if payload is not None:
+            return payload, 200
+
+        with span('simulation'):
+            projections = self.simulator.run(teams, grid, schedule, wins, simulations, seed)
+
+        payload = {
+            'model_version': bundle.version,
+            'data_version': self.extractor.data_version,
+            'simulations': simulations,
+            'seed': seed,
+            'games': len(schedule),
+            'teams': projections
+        }
+        self.simulation_cache.put(cache_key, payload)
+        logger.info("Simulated %d games %d times", len(schedule), simulations)
+        return payload, 200
+
+    def ingest(self, games):
+        """Append newly played games to the extractor"""
+        if not isinstance(games, list):
+            return {'error': 'Expected a JSON body with a "games" list'}, 400
+
+        try:
+            ingested = self.extractor.append_games(games)
+        except (ValueError, TypeError, KeyError) as e:
+            return {'error': str(e)}, 400
+
+        # Cached predictions were built from the previous data version
+        if ingested:
+            self.prediction_cache.clear()
+
+        return {
+            'ingested': ingested,
+            'skipped': len(games) - ingested,
+            'data_version': self.extractor.data_version
+        }, 200
+
+    def reload_model(self):
+        """Load and validate off the request thread; traffic keeps using the live bundle"""
+        self.registry.reload_in_background()
+
+        current = self.registry.current
+        return {
+            'status': 'reloading',
+            'current_version': current.version if current is not None else None,
+            'last_error': self.registry.last_error
+        }, 202
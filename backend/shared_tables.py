@@ -0,0 +1,81 @@
+import json
+import os
+import shutil
+import tempfile
+import numpy as np
+
+TABLES_VERSION = 1
+
+def shared_memory_dir():
+    """tmpfs when the platform has one, so table files never touch disk"""
+    return '/dev/shm' if os.path.isdir('/dev/shm') else tempfile.gettempdir()
+
+def stats_dtype(records):
+    """Structured dtype for team stats records: text columns as fixed-width strings"""
+    fields = []
+    for name, value in next(iter(records.values())).items():
+        if isinstance(value, str):
+            width = max(len(record[name]) for record in records.values())
+            fields.append((name, f'U{width}'))
+        elif isinstance(value, (int, np.integer)):
+            fields.append((name, np.int64))
+        else:
+            fields.append((name, np.float64))
+    return np.dtype(fields)
+
+def export_tables(extractor, team_stats, directory=None):
+    """Write the per-team feature matrix and team stats table for workers to map
+
+    Returns the directory holding the tables; pass it to attach_tables in each
+    worker and remove it with remove_tables on shutdown.
+    """
+    directory = tempfile.mkdtemp(prefix='nba-tables-', dir=directory or shared_memory_dir())
+
+    teams = sorted(extractor.team_index)
+    features = np.stack([extractor.team_index[team] for team in teams])
+    np.save(os.path.join(directory, 'team_features.npy'), features)
+
+    records = team_stats.records
+    stats = np.array([tuple(record.values()) for record in records.values()], dtype=stats_dtype(records))
+    np.save(os.path.join(directory, 'team_stats.npy'), stats)
+
+    manifest = {
+        'version': TABLES_VERSION,
+        'teams': teams,
+        'stats_teams': list(records),
+        'data_version': extractor.data_version,
+        'team_stats_mtime': team_stats.mtime
+    }
+    with open(os.path.join(directory, 'tables.json'), 'w') as f:
+        json.dump(manifest, f)
+
+    print(f"🧠 Exported feature tables for {len(teams)} teams to {directory}")
+    return directory
+
+def attach_tables(extractor, team_stats, directory):
+    """Point the extractor and team stats at read-only maps of the exported tables
+
+    Every worker maps the same pages, so per-team lookups cost no private
+    memory. Tables that no longer match the in-process state are left alone.
+    """
+    with open(os.path.join(directory, 'tables.json')) as f:
+        manifest = json.load(f)
+
+    if manifest.get('version') != TABLES_VERSION:
+        return False
+
+    attached = False
+    if manifest['data_version'] == extractor.data_version:
+        features = np.asarray(np.load(os.path.join(directory, 'team_features.npy'), mmap_mode='r'))
+        extractor.team_index = {team: features[i] for i, team in enumerate(manifest['teams'])}
+        attached = True
+
+    if manifest['team_stats_mtime'] == team_stats.mtime:
+        stats = np.asarray(np.load(os.path.join(directory, 'team_stats.npy'), mmap_mode='r'))
+        team_stats.records = {team: stats[i] for i, team in enumerate(manifest['stats_teams'])}
+        attached = True
+
+    return attached
+
+def remove_tables(directory):
+    shutil.rmtree(directory, ignore_errors=True)
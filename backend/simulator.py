@@ -0,0 +1,142 @@
+import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+
+CONFERENCES = {
+    'East': ['ATL', 'BOS', 'BRK', 'CHI', 'CHO', 'CLE', 'DET', 'IND', 'MIA', 'MIL', 'NYK', 'ORL', 'PHI', 'TOR', 'WAS'],
+    'West': ['DAL', 'DEN', 'GSW', 'HOU', 'LAC', 'LAL', 'MEM', 'MIN', 'NOP', 'OKC', 'PHO', 'POR', 'SAC', 'SAS', 'UTA']
+}
+
+# Seeds 1-6 go straight to the playoffs, 7-10 play in for the last two spots
+PLAYOFF_SEEDS = 6
+PLAY_IN_SEEDS = 10
+
+# Seasons simulated per process-pool task
+CHUNK_SIZE = 2500
+
+# Below this many simulated games a pool round trip costs more than it saves
+PARALLEL_MIN_DRAWS = 2_000_000
+
+def simulate_chunk(probabilities, home_idx, away_idx, base_wins, conferences, simulations, seed, max_wins):
+    """Simulate `simulations` seasons at once and count win totals and seeds
+
+    Every season is a row of one random matrix; a team's wins are its base
+    wins plus the games it won as home team and as away team. Returns
+    (win_counts[team, wins], seed_counts[team, seed - 1]).
+    """
+    rng = np.random.default_rng(seed)
+    n_teams = len(base_wins)
+    n_games = len(probabilities)
+
+    home_won = rng.random((simulations, n_games)) < probabilities
+
+    # Away teams win every game unless the home team did: wins = base + away games + home_won @ (home - away)
+    incidence = np.zeros((n_games, n_teams), dtype=np.float32)
+    np.add.at(incidence, (np.arange(n_games), home_idx), 1)
+    np.add.at(incidence, (np.arange(n_games), away_idx), -1)
+    away_games = np.bincount(away_idx, minlength=n_teams)
+    wins = (home_won.astype(np.float32) @ incidence).astype(np.int64) + base_wins + away_games
+
+    win_counts = np.bincount(
+        (np.arange(n_teams) * (max_wins + 1) + wins).ravel(), minlength=n_teams * (max_wins + 1)
+    ).reshape(n_teams, max_wins + 1)
+
+    max_seeds = max((len(members) for members in conferences), default=0)
+    seed_counts = np.zeros((n_teams, max_seeds), dtype=np.int64)
+    for members in conferences:
+        # Rank by wins, breaking ties at random
+        keys = wins[:, members] + rng.random((simulations, len(members)))
+        ranks = np.argsort(np.argsort(-keys, axis=1), axis=1)
+        counts = np.bincount((np.arange(len(members)) * max_seeds + ranks).ravel(),
+                             minlength=len(members) * max_seeds)
+        seed_counts[members] = counts.reshape(len(members), max_seeds)
+
+    return win_counts, seed_counts
+
+class SeasonSimulator:
+    """Monte Carlo projections of the remaining schedule from a home win probability grid
+
+    Large runs are split into chunks of seasons and spread over a process pool,
+    created on first use and kept for later runs.
+    """
+
+    def __init__(self, processes=None):
+        self.processes = processes or os.cpu_count() or 1
+        self.pool = None
+
+    def get_pool(self):
+        if self.pool is None:
+            # Workers start from a clean interpreter that only imports this module,
+            # not the server's __main__, threads or locks
+            if 'forkserver' in multiprocessing.get_all_start_methods():
+                context = multiprocessing.get_context('forkserver')
+                context.set_forkserver_preload([__name__])
+            else:
+                context = multiprocessing.get_context('spawn')
+            self.pool = ProcessPoolExecutor(max_workers=self.processes, mp_context=context)
+        return self.pool
+
+    def run(self, teams, grid, schedule, base_wins, simulations=10000, seed=0):
+        """Simulate the schedule and summarize each team's outcomes
+
+        grid[i][j] is the probability that teams[i] beats teams[j] at home;
+        schedule is a list of (home_team, away_team) pairs and base_wins maps
+        teams to wins already banked.
+        """
+        position = {team: i for i, team in enumerate(teams)}
+        home_idx = np.array([position[home] for home, _ in schedule], dtype=np.int64)
+        away_idx = np.array([position[away] for _, away in schedule], dtype=np.int64)
+        probabilities = grid[home_idx, away_idx]
+        wins = np.array([int(base_wins.get(team, 0)) for team in teams], dtype=np.int64)
+        games_left = np.bincount(np.concatenate([home_idx, away_idx]), minlength=len(teams))
+        max_wins = int((wins + games_left).max())
+
+        conferences = [
+            np.array([position[team] for team in members if team in position], dtype=np.int64)
+            for members in CONFERENCES.values()
+        ]
+
+        # Independent, reproducible streams per chunk
+        chunks = [min(CHUNK_SIZE, simulations - start) for start in range(0, simulations, CHUNK_SIZE)]
+        seeds = np.random.SeedSequence(seed).spawn(len(chunks))
+        args = [(probabilities, home_idx, away_idx, wins, conferences, size, chunk_seed, max_wins)
+                for size, chunk_seed in zip(chunks, seeds)]
+
+        if self.processes > 1 and len(chunks) > 1 and simulations * len(schedule) >= PARALLEL_MIN_DRAWS:
+            results = list(self.get_pool().map(simulate_chunk, *zip(*args)))
+        else:
+            results = [simulate_chunk(*chunk_args) for chunk_args in args]
+
+        win_counts = sum(result[0] for result in results)
+        seed_counts = sum(result[1] for result in results)
+        return self.summarize(teams, wins, win_counts, seed_counts, simulations)
+
+    def summarize(self, teams, base_wins, win_counts, seed_counts, simulations):
+        conference_of = {team: name for name, members in CONFERENCES.items() for team in members}
+        totals = np.arange(win_counts.shape[1])
+
+        projections = {}
+        for i, team in enumerate(teams):
+            win_probs = win_counts[i] / simulations
+            cumulative = np.cumsum(win_probs)
+            seed_probs = seed_counts[i] / simulations
+            conference = conference_of.get(team)
+            projections[team] = {
+                'conference': conference,
+                'current_wins': int(base_wins[i]),
+                'mean_wins': float(win_probs @ totals),
+                'wins_p5': int(np.searchsorted(cumulative, 0.05)),
+                'wins_p50': int(np.searchsorted(cumulative, 0.5)),
+                'wins_p95': int(np.searchsorted(cumulative, 0.95)),
+                'win_distribution': {int(w): float(win_probs[w]) for w in np.flatnonzero(win_counts[i])},
+                'seed_probabilities': [float(p) for p in seed_probs] if conference else None,
+                'playoff_probability': float(seed_probs[:PLAYOFF_SEEDS].sum()) if conference else None,
+                'play_in_probability': float(seed_probs[PLAYOFF_SEEDS:PLAY_IN_SEEDS].sum()) if conference else None
+            }
+        return projections
+
+    def shutdown(self):
+        if self.pool is not None:
+            self.pool.shutdown(wait=False)
+            self.pool = None
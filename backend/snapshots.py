@@ -0,0 +1,111 @@
+import gzip
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+
+# Snapshots kept on disk; older ones are pruned when a new one is written
+KEEP_SNAPSHOTS = 7
+
+VERSION_PATTERN = re.compile(r'^[0-9a-f]{12}$')
+
+def snapshot_file(version):
+    return f'upcoming-{version}.json.gz'
+
+def write_snapshot(payload, directory, keep=KEEP_SNAPSHOTS):
+    """Write a gzip-compressed snapshot and point latest.json at it
+
+    The version is a hash of the content, so rewriting identical
+    predictions keeps the same version (and every client cache entry).
+    """
+    os.makedirs(directory, exist_ok=True)
+    body = json.dumps(payload, sort_keys=True).encode()
+    version = hashlib.md5(body).hexdigest()[:12]
+
+    # Write then rename so the API never serves a half-written file
+    path = os.path.join(directory, snapshot_file(version))
+    if os.path.exists(path):
+        os.utime(path)  # newest again, so pruning keeps it
+    else:
+        with open(path + '.tmp', 'wb') as f:
+            f.write(gzip.compress(body, compresslevel=9, mtime=0))
+        os.replace(path + '.tmp', path)
+
+    latest = os.path.join(directory, 'latest.json')
+    with open(latest + '.tmp', 'w') as f:
+        json.dump({'version': version, 'file': snapshot_file(version)}, f)
+    os.replace(latest + '.tmp', latest)
+
+    snapshots = sorted(
+        (name for name in os.listdir(directory) if name.startswith('upcoming-') and name.endswith('.json.gz')),
+        key=lambda name: os.stat(os.path.join(directory, name)).st_mtime_ns
+    )
+    for name in snapshots[:-keep]:
+        os.remove(os.path.join(directory, name))
+
+    return version, path
+
+class SnapshotStore:
+    """Gzip-compressed prediction snapshots, served as stored bytes
+
+    latest.json names the current snapshot; it is re-read at most once per
+    check_interval seconds, and only when its mtime changes.
+    """
+
+    def __init__(self, directory='data/snapshots', check_interval=1.0):
+        self.directory = directory
+        self.check_interval = check_interval
+        self.lock = threading.Lock()
+        self.last_check = 0.0
+        self.mtime = None
+
+        # (version, compressed bytes) of the latest snapshot, swapped as one object
+        self.latest = None
+        self.refresh()
+
+    def refresh(self):
+        now = time.monotonic()
+        if self.mtime is not None and now - self.last_check < self.check_interval:
+            return False
+        self.last_check = now
+
+        try:
+            mtime = os.stat(os.path.join(self.directory, 'latest.json')).st_mtime_ns
+        except OSError:
+            return False
+
+        if mtime == self.mtime:
+            return False
+
+        with self.lock:
+            if mtime == self.mtime:
+                return False
+            with open(os.path.join(self.directory, 'latest.json')) as f:
+                version = json.load(f)['version']
+            compressed = self.read(version)
+            if compressed is None:
+                return False
+            self.latest = (version, compressed)
+            self.mtime = mtime
+        print(f"🗓️ Serving prediction snapshot {version}")
+        return True
+
+    def read(self, version):
+        """Compressed bytes of a snapshot version, or None if it isn't on disk"""
+        if not VERSION_PATTERN.match(version):
+            return None
+        try:
+            with open(os.path.join(self.directory, snapshot_file(version)), 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def get(self, version):
+        """Compressed bytes for a version, from memory when it's the latest one"""
+        self.refresh()
+        latest = self.latest
+        if latest is not None and version == latest[0]:
+            return latest[1]
+        return self.read(version)
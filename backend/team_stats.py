@@ -0,0 +1,87 @@
+import hashlib
+import json
+import os
+import threading
+import time
+import pandas as pd
+
+class TeamStatsIndex:
+    """team_stats.csv as a dict of records keyed by team code
+
+    The /api/teams payload is serialized once per file version along with its
+    ETag, and everything is rebuilt only when the file's mtime changes.
+    """
+
+    def __init__(self, path='data/team_stats.csv', check_interval=1.0):
+        self.path = path
+        self.check_interval = check_interval
+        self.lock = threading.Lock()
+        self.last_check = 0.0
+        self.mtime = None
+        self.records = {}
+        # (payload, ETag), swapped as one object so readers never pair a body with another's tag
+        self.teams_response = (b'[]', None)
+        self.refresh()
+
+    def refresh(self):
+        """Reload the stats file if it changed since the last load
+
+        The file is stat'ed at most once per check_interval seconds.
+        """
+        now = time.monotonic()
+        if self.mtime is not None and now - self.last_check < self.check_interval:
+            return False
+        self.last_check = now
+
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except OSError:
+            return False
+
+        if mtime == self.mtime:
+            return False
+
+        with self.lock:
+            if mtime == self.mtime:
+                return False
+            self.load(mtime)
+        return True
+
+    def load(self, mtime):
+        team_stats = pd.read_csv(self.path)
+        records = {record['Team']: record for record in team_stats.to_dict('records')}
+
+        teams_data = []
+        for team in records.values():
+            teams_data.append({
+                'name': team['Team'],
+                'games_played': int(team['GP']),
+                'wins': int(team['W']),
+                'losses': int(team['L']),
+                'win_percentage': float(team['W'] / team['GP']),
+                'points_per_game': float(team['PTS']),
+                'field_goal_percentage': float(team['FG%']),
+                'three_point_percentage': float(team['3P%']),
+                'free_throw_percentage': float(team['FT%']),
+                'rebounds_per_game': float(team['TRB']),
+                'assists_per_game': float(team['AST']),
+                'steals_per_game': float(team['STL']),
+                'blocks_per_game': float(team['BLK']),
+                'turnovers_per_game': float(team['TOV'])
+            })
+
+        payload = json.dumps(teams_data).encode()
+
+        # Publish the payload and its ETag together in a single attribute store
+        self.records = records
+        self.teams_response = (payload, hashlib.md5(payload).hexdigest())
+        self.mtime = mtime
+        print(f"📋 Indexed stats for {len(records)} teams")
+
+    def get(self, team):
+        """Stats record for a team code; raises KeyError for unknown teams"""
+        self.refresh()
+        record = self.records.get(team)
+        if record is None:
+            raise KeyError(f"No team stats for {team}")
+        return record